@@ -0,0 +1,337 @@
+"""Micro-benchmarks for the humanize batch APIs and fast paths.
+
+Run from the repository root:
+
+    python scripts/benchmark.py            # run every benchmark
+    python scripts/benchmark.py intcomma   # run only the named benchmarks
+    python scripts/benchmark.py directory_sizes:20000  # with another element count
+
+Each benchmark prints the per-element cost of the scalar loop next to the cost of
+the batch or fast-path variant it is compared with.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from humanize import filesize, number, time  # noqa: E402
+from humanize.i18n import _gettext, _ngettext  # noqa: E402
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BENCHMARKS: dict[str, Callable[..., None]] = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__[len("bench_") :]] = func
+    return func
+
+
+def report(label, stmt, count, repeat=5):
+    """Print the best per-element time of `stmt` over `repeat` runs."""
+    best = min(timeit.repeat(stmt, number=1, repeat=repeat))
+    print(f"  {label:<40} {best / count * 1e9:10.1f} ns/element")
+
+
+@benchmark
+def bench_intcomma(count=100_000):
+    values = list(range(-count // 2, count // 2))
+    floats = [value * 1.25 for value in values]
+    report("intcomma loop (int)", lambda: [number.intcomma(v) for v in values], count)
+    report("intcomma_many (int)", lambda: number.intcomma_many(values), count)
+    report("intcomma loop (float)", lambda: [number.intcomma(v) for v in floats], count)
+    report("intcomma_many (float)", lambda: number.intcomma_many(floats), count)
+    try:
+        import numpy
+    except ImportError:
+        return
+    array = numpy.arange(-count // 2, count // 2, dtype=numpy.int64)
+    report("intcomma_many (numpy int64)", lambda: number.intcomma_many(array), count)
+
+
+@benchmark
+def bench_intword(count=100_000):
+    values = [(i * 7919) ** 3 for i in range(count)]
+    report("intword loop", lambda: [number.intword(v) for v in values], count)
+    report("intword_many", lambda: number.intword_many(values), count)
+
+
+@benchmark
+def bench_metric(count=100_000):
+    values = [(i % 2000 - 1000) * 10.0 ** (i % 40 - 20) for i in range(count)]
+    report("metric loop", lambda: [number.metric(v, "V") for v in values], count)
+    report("metric_many", lambda: number.metric_many(values, "V"), count)
+
+
+@benchmark
+def bench_scientific(count=100_000):
+    values = [(i - count // 2) * 10.0 ** (i % 60 - 30) for i in range(count)]
+    report("scientific loop", lambda: [number.scientific(v) for v in values], count)
+    report("scientific_many", lambda: number.scientific_many(values), count)
+
+
+@benchmark
+def bench_fractional(count=100_000):
+    common = [0.25, 1 / 3, 1.5, 0.125, 2.75, 0.2, 0.6666666]
+    values = [common[i % len(common)] for i in range(count)]
+    report("fractional loop", lambda: [number.fractional(v) for v in values], count)
+    report("fractional_many", lambda: number.fractional_many(values), count)
+
+
+@benchmark
+def bench_decimal(count=100_000):
+    from decimal import Decimal
+
+    values = [Decimal(i * 7919) / 100 for i in range(count)]
+    for func in (number.intcomma, number.scientific):
+        name = func.__name__
+        report(f"{name} via float", lambda: [func(float(v)) for v in values], count)
+        report(f"{name} on Decimal", lambda: [func(v) for v in values], count)
+
+
+@benchmark
+def bench_parse_intword(count=100_000):
+    texts = number.intword_many([(i * 7919) ** 3 for i in range(count)])
+    report("parse_intword loop", lambda: [number.parse_intword(t) for t in texts], count)
+    report("parse_intword_many", lambda: number.parse_intword_many(texts), count)
+
+
+@benchmark
+def bench_coercion(count=100_000):
+    from decimal import Decimal
+
+    inputs = {
+        "int": list(range(count)),
+        "float": [i + 0.5 for i in range(count)],
+        "Decimal": [Decimal(i) for i in range(count)],
+        "str": [str(i) for i in range(count)],
+    }
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        inputs["numpy.int64"] = list(numpy.arange(count))
+    # A bound formatter leaves little besides the input coercion in the loop
+    ordinal = number.NumberFormatter(number.ordinal)
+    for kind, values in inputs.items():
+        report(f"bound ordinal ({kind})", lambda: [ordinal(v) for v in values], count)
+
+
+@benchmark
+def bench_naturalsize(count=100_000):
+    values = [(i * 7919) ** 2 for i in range(count)]
+    report("naturalsize loop", lambda: [filesize.naturalsize(v) for v in values], count)
+    report("naturalsize_many", lambda: filesize.naturalsize_many(values), count)
+    try:
+        import numpy
+    except ImportError:
+        return
+    array = numpy.array(values, dtype=numpy.int64)
+    report(
+        "naturalsize_many (numpy int64)",
+        lambda: filesize.naturalsize_many(array),
+        count,
+    )
+
+
+@benchmark
+def bench_parse_size(count=100_000):
+    texts = filesize.naturalsize_many([(i * 7919) ** 2 for i in range(count)], binary=True)
+    report("parse_size loop", lambda: [filesize.parse_size(t) for t in texts], count)
+    report("parse_size_many", lambda: filesize.parse_size_many(texts), count)
+
+
+@benchmark
+def bench_rate_meter(count=100_000):
+    def format_every_chunk():
+        for done in range(0, count * 65536, 65536):
+            f"{filesize.naturalsize(done)}/s, {time.naturaldelta(done / 1e9)} left"
+
+    def meter_updates():
+        meter = filesize.RateMeter(total=count * 65536)
+        for _ in range(count):
+            meter.update(65536)
+
+    report("naturalsize + naturaldelta per chunk", format_every_chunk, count)
+    report("RateMeter.update", meter_updates, count)
+
+
+@benchmark
+def bench_naturaldelta(count=100_000):
+    import datetime as dt
+    import random
+
+    rng = random.Random(0)
+    deltas = [dt.timedelta(seconds=rng.expovariate(1 / 86_400)) for _ in range(count)]
+    report("naturaldelta loop", lambda: [time.naturaldelta(d) for d in deltas], count)
+    report("naturaldelta_many", lambda: time.naturaldelta_many(deltas), count)
+    moments = [dt.datetime.now() - delta for delta in deltas]
+    report("naturaltime loop", lambda: [time.naturaltime(m) for m in moments], count)
+    report("naturaltime_many", lambda: time.naturaltime_many(moments), count)
+    time.set_render_cache(4096)
+    report("naturaldelta loop (cache)", lambda: [time.naturaldelta(d) for d in deltas], count)
+    report("naturaltime loop (cache)", lambda: [time.naturaltime(m) for m in moments], count)
+    print(f"  {time.render_cache_info()}")
+    time.set_render_cache(None)
+    try:
+        import numpy
+    except ImportError:
+        return
+    array = numpy.array(moments, dtype="datetime64[us]")
+    report("naturaltime_many (datetime64)", lambda: time.naturaltime_many(array), count)
+
+
+@benchmark
+def bench_naturaldate(count=100_000):
+    import datetime as dt
+
+    today = dt.date.today()
+    dates = [today - dt.timedelta(days=i % 90) for i in range(count)]
+    report("naturaldate loop", lambda: [time.naturaldate(d) for d in dates], count)
+    report("naturaldate_many", lambda: time.naturaldate_many(dates), count)
+
+
+def _quotient_and_remainder(value, divisor, unit, minimum_unit, suppress, format):
+    """The float division `precisedelta` used before it split on integer microseconds."""
+    if unit == minimum_unit:
+        return time._rounding_by_fmt(format, value / divisor), 0
+    if unit in suppress:
+        return 0, value
+    q, r = divmod(value, divisor)
+    return q, int(r)
+
+
+class FloatSplitPlan(time.PrecisedeltaPlan):
+    """A `PrecisedeltaPlan` formatting with the float split it replaced, for comparison."""
+
+    def _format(self, delta):
+        import math
+
+        Unit = time.Unit
+        min_unit = self._min_unit
+        suppress_set = self._suppress
+        format = self.format
+        days = delta.days
+        secs = delta.seconds
+        usecs = delta.microseconds
+        promote = [unit not in suppress_set for unit in Unit]
+        to_seconds, to_minutes, to_hours, to_days, to_months, to_years = promote[2:]
+
+        def split(value, divisor, unit):
+            return _quotient_and_remainder(
+                value, divisor, unit, min_unit, suppress_set, format
+            )
+
+        years, days = split(days, 365, Unit.YEARS)
+        months, days = split(days, 30.5, Unit.MONTHS)
+        secs = days * 24 * 3600 + secs
+        days, secs = split(secs, 24 * 3600, Unit.DAYS)
+        hours, secs = split(secs, 3600, Unit.HOURS)
+        minutes, secs = split(secs, 60, Unit.MINUTES)
+        usecs = secs * 1e6 + usecs
+        secs, usecs = split(usecs, 1e6, Unit.SECONDS)
+        msecs, usecs = split(usecs, 1000, Unit.MILLISECONDS)
+
+        if msecs >= 1_000 and to_seconds:
+            msecs -= 1_000
+            secs += 1
+        if secs >= 60 and to_minutes:
+            secs -= 60
+            minutes += 1
+        if minutes >= 60 and to_hours:
+            minutes -= 60
+            hours += 1
+        if hours >= 24 and to_days:
+            hours -= 24
+            days += 1
+        if days >= 31 and to_months:
+            days -= 31
+            months += 1
+        if months >= 12 and to_years:
+            months -= 12
+            years += 1
+
+        texts = []
+        values = (years, months, days, hours, minutes, secs, msecs, usecs)
+        for unit, message, fmt_value in zip(self._units, self._messages, values):
+            singular_txt, plural_txt = message
+            if fmt_value > 0 or (not texts and unit == min_unit):
+                _fmt_value = 2 if 1 < fmt_value < 2 else int(fmt_value)
+                fmt_txt = _ngettext(singular_txt, plural_txt, _fmt_value)
+                if unit == min_unit and math.modf(fmt_value)[0] > 0:
+                    fmt_txt = fmt_txt.replace("%d", format)
+                elif unit == Unit.YEARS:
+                    if math.modf(fmt_value)[0] == 0:
+                        fmt_value = int(fmt_value)
+                    fmt_txt = fmt_txt.replace("%d", "%s")
+                    texts.append(fmt_txt % number.intcomma(fmt_value))
+                    continue
+                texts.append(fmt_txt % fmt_value)
+
+        if len(texts) == 1:
+            return texts[0]
+        return _gettext("%s and %s") % (", ".join(texts[:-1]), texts[-1])
+
+
+@benchmark
+def bench_precisedelta(count=100_000):
+    import datetime as dt
+    import random
+
+    rng = random.Random(0)
+    deltas = [dt.timedelta(seconds=rng.expovariate(1 / 86_400)) for _ in range(count)]
+    plan = time.PrecisedeltaPlan(minimum_unit="seconds", suppress=["days"])
+    reference = FloatSplitPlan(minimum_unit="seconds", suppress=["days"])
+    assert reference.map(deltas) == plan.map(deltas)
+    report(
+        "precisedelta loop",
+        lambda: [time.precisedelta(d, "seconds", ["days"]) for d in deltas],
+        count,
+    )
+    report("PrecisedeltaPlan.map (float split)", lambda: reference.map(deltas), count)
+    report("PrecisedeltaPlan.map", lambda: plan.map(deltas), count)
+
+
+@benchmark
+def bench_directory_sizes(count=1_000_000):
+    import os
+    import tempfile
+
+    def walk_sizes(root):
+        sizes = {}
+        for path, dirnames, filenames in os.walk(root, topdown=False):
+            sizes[path] = sum(os.stat(os.path.join(path, name)).st_size for name in filenames)
+            sizes[path] += sum(sizes[os.path.join(path, name)] for name in dirnames)
+        return sizes
+
+    with tempfile.TemporaryDirectory() as root:
+        # 100 files per directory, 100 directories per parent directory
+        for i in range(count):
+            directory = os.path.join(root, str(i // 10_000), str(i // 100 % 100))
+            if i % 100 == 0:
+                os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, str(i)), "wb") as file:
+                file.write(b"x" * (i % 512))
+        report("os.walk + os.stat", lambda: walk_sizes(root), count, repeat=1)
+        report("directory_sizes", lambda: list(filesize.directory_sizes(root)), count, repeat=1)
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        name, _, count = name.partition(":")
+        print(f"{name}:")
+        if count:
+            BENCHMARKS[name](int(count))
+        else:
+            BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
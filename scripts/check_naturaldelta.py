@@ -0,0 +1,188 @@
+"""Check the table-driven `naturaldelta` against the original per-call algorithm.
+
+Run from the repository root:
+
+    python scripts/check_naturaldelta.py
+
+`reference_naturaldelta` below is the implementation `naturaldelta` had before it was
+rewritten around a precomputed table of boundaries. Both are run over every
+microsecond of the first two seconds, every second of the first two days, every day
+of the first ~5.5 years, random deltas in between and beyond, and their negations,
+for each minimum unit, with and without months. This covers every unit and month
+boundary. The comparison is repeated with a fake translation, which catches
+messages that are looked up with the wrong id or count. Any mismatch is printed and
+makes the script exit with status 1.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import gettext
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from humanize import i18n, time  # noqa: E402
+from humanize.number import intcomma  # noqa: E402
+
+
+def reference_naturaldelta(delta, months=True, minimum_unit="seconds"):
+    """Return what `naturaldelta` said about a timedelta before the table rewrite."""
+    _ = i18n._gettext
+    _ngettext = i18n._ngettext
+    min_unit = time.Unit[minimum_unit.upper()]
+
+    delta = abs(delta)
+    years = delta.days // 365
+    days = delta.days % 365
+    num_months = round(days / 30.5)
+
+    if years == 0 and days < 1:
+        if delta.seconds == 0:
+            if min_unit == time.Unit.MICROSECONDS and delta.microseconds < 1000:
+                return (
+                    _ngettext("%d microsecond", "%d microseconds", delta.microseconds)
+                    % delta.microseconds
+                )
+
+            if min_unit == time.Unit.MILLISECONDS or (
+                min_unit == time.Unit.MICROSECONDS
+                and 1000 <= delta.microseconds < 1_000_000
+            ):
+                milliseconds = delta.microseconds / 1000
+                return (
+                    _ngettext("%d millisecond", "%d milliseconds", int(milliseconds))
+                    % milliseconds
+                )
+            return _("a moment")
+
+        if delta.seconds == 1:
+            return _("a second")
+
+        if delta.seconds < 60:
+            return _ngettext("%d second", "%d seconds", delta.seconds) % delta.seconds
+
+        if 60 <= delta.seconds < 3600:
+            minutes = round(delta.seconds / 60)
+            if minutes == 1:
+                return _("a minute")
+
+            if minutes == 60:
+                return _("an hour")
+
+            return _ngettext("%d minute", "%d minutes", minutes) % minutes
+
+        hours = round(delta.seconds / 3600)
+        if hours == 1:
+            return _("an hour")
+
+        if hours == 24:
+            return _("a day")
+
+        return _ngettext("%d hour", "%d hours", hours) % hours
+
+    if years == 0:
+        if days == 1:
+            return _("a day")
+
+        if not months or num_months == 0:
+            return _ngettext("%d day", "%d days", days) % days
+
+        if num_months == 1:
+            return _("a month")
+
+        if num_months == 12:
+            return _("a year")
+
+        return _ngettext("%d month", "%d months", num_months) % num_months
+
+    if years == 1:
+        if num_months == 0 and days == 0:
+            return _("a year")
+
+        if num_months == 0:
+            return _ngettext("1 year, %d day", "1 year, %d days", days) % days
+
+        if months:
+            if num_months == 1:
+                return _("1 year, 1 month")
+
+            if num_months == 12:
+                years += 1
+                return _ngettext("%d year", "%d years", years) % years
+
+            return (
+                _ngettext("1 year, %d month", "1 year, %d months", num_months)
+                % num_months
+            )
+
+        return _ngettext("1 year, %d day", "1 year, %d days", days) % days
+
+    return _ngettext("%d year", "%d years", years).replace("%d", "%s") % intcomma(years)
+
+
+class ShoutingTranslation(gettext.NullTranslations):
+    """A translation that changes every message, and picks plurals by `n % 3`."""
+
+    def gettext(self, message):
+        return message.upper()
+
+    def ngettext(self, singular, plural, n):
+        return (singular if n % 3 == 1 else plural).upper().replace("%D", "%d")
+
+
+def deltas(rng):
+    """Return the timedeltas to compare, around every boundary of the table."""
+    second = [dt.timedelta(microseconds=us) for us in range(2_100_000)]
+    days = [dt.timedelta(seconds=s) for s in range(2 * 86_400 + 5)]
+    days += [
+        dt.timedelta(seconds=s, microseconds=rng.randrange(10**6))
+        for s in range(0, 2 * 86_400, 7)
+    ]
+    years = [dt.timedelta(days=d) for d in range(2000)]
+    years += [
+        dt.timedelta(
+            days=d, seconds=rng.randrange(86_400), microseconds=rng.randrange(10**6)
+        )
+        for d in range(2000)
+        for _ in range(3)
+    ]
+    years += [dt.timedelta(days=rng.randrange(10**9 - 1)) for _ in range(1000)]
+    corpus = second + days + years
+    return corpus + [-delta for delta in corpus[::97]]
+
+
+def main():
+    corpus = deltas(random.Random(0))
+    checked = mismatches = 0
+    try:
+        for translation in (None, ShoutingTranslation()):
+            if translation is not None:
+                # Install the fake translation as the active one
+                i18n._TRANSLATIONS["check"] = translation
+                i18n._CURRENT.locale = "check"
+                corpus = corpus[::50]
+            for minimum_unit in ("seconds", "milliseconds", "microseconds"):
+                for months in (True, False):
+                    for delta in corpus:
+                        checked += 1
+                        expected = reference_naturaldelta(delta, months, minimum_unit)
+                        actual = time.naturaldelta(delta, months, minimum_unit)
+                        if actual != expected:
+                            mismatches += 1
+                            print(
+                                f"{delta!r}, months={months}, "
+                                f"minimum_unit={minimum_unit!r}: "
+                                f"{actual!r} != {expected!r}"
+                            )
+    finally:
+        i18n._TRANSLATIONS.pop("check", None)
+        i18n.deactivate()
+    print(f"{checked} deltas checked, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Summarize disk usage of directory trees with human-readable sizes.
+
+Run as `python -m humanize.du [PATH ...]`. Directories are scanned in parallel with
+`humanize.filesize.directory_sizes` and printed as soon as their subtree is done,
+with sizes formatted by `humanize.filesize.naturalsize`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import stat
+import sys
+from collections import deque
+
+from .filesize import directory_sizes, naturalsize
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Print the total size of every directory below the given paths.
+
+    As with `du`, a path that is not a directory is printed with its own size, and a
+    path that cannot be read is only reported as an error.
+
+    Args:
+        argv (sequence of str, None): Command line arguments. If `None`, those of the
+            process are used.
+
+    Returns:
+        int: Exit status, 1 if some entries could not be read and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m humanize.du",
+        description="Summarize the apparent size of directory trees.",
+    )
+    parser.add_argument("paths", nargs="*", default=["."], metavar="PATH")
+    parser.add_argument(
+        "-s", "--summarize", action="store_true", help="only print the total of each PATH"
+    )
+    parser.add_argument(
+        "-b", "--binary", action="store_true", help="use binary suffixes (KiB, MiB)"
+    )
+    parser.add_argument(
+        "-g", "--gnu", action="store_true", help="use GNU-style suffixes (K, M)"
+    )
+    parser.add_argument("-f", "--format", default="%.1f", help="number format (%(default)s)")
+    parser.add_argument("-j", "--workers", type=int, help="number of scanning threads")
+    parser.add_argument(
+        "-L", "--dereference", action="store_true", help="follow symbolic links"
+    )
+    args = parser.parse_args(argv)
+
+    errors = []
+
+    def onerror(error: OSError) -> None:
+        errors.append(error)
+        print(f"du: {error}", file=sys.stderr)
+
+    for path in args.paths:
+        try:
+            info = os.stat(path) if args.dereference else os.lstat(path)
+        except OSError as error:
+            onerror(error)
+            continue
+        if stat.S_ISDIR(info.st_mode):
+            sizes = directory_sizes(path, args.workers, args.dereference, onerror)
+        else:
+            sizes = iter([(path, info.st_size)])
+        lines = deque(sizes, maxlen=1) if args.summarize else sizes
+        for directory, size in lines:
+            size_text = naturalsize(size, args.binary, args.gnu, args.format)
+            print(f"{size_text}\t{directory}", flush=not args.summarize)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
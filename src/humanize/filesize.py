@@ -2,7 +2,28 @@
 
 from __future__ import annotations
 
-from math import log
+import math
+import operator
+import os
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from time import monotonic
+
+from .i18n import _gettext as _
+from .i18n import decimal_separator
+from .number import (
+    _fixed_point_precision,
+    _format_quotient,
+    _pack_results,
+    _unpack_values,
+)
+from .time import naturaldelta
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any
 
 suffixes = {
     "decimal": (
@@ -32,6 +53,19 @@ suffixes = {
     "gnu": "KMGTPEZYRQ",
 }
 
+# Smallest number of bytes shown with each suffix, by base. These are floats because
+# sizes are compared as floats: the decimal ones are the floats closest to 1000**n.
+_thresholds = {
+    1000: tuple(float(f"1e{3 * exp}") for exp in range(1, 11)),
+    1024: tuple(float(1024**exp) for exp in range(1, 11)),
+}
+# The same thresholds, exactly, for int sizes
+_int_thresholds = {base: tuple(base**exp for exp in range(1, 11)) for base in (1000, 1024)}
+# Longest time left `RateMeter` estimates, in seconds
+_MAX_ETA = 365 * 24 * 60 * 60
+# Largest exponent `parse_size` accepts, so that it never computes a huge power of 10
+_MAX_SIZE_EXPONENT = 4300
+
 
 def naturalsize(
     value: float | str,
@@ -59,10 +93,16 @@ def naturalsize(
         '2.9 KiB'
         >>> naturalsize(10**28)
         '10.0 RB'
+        >>> naturalsize(1000**5)
+        '1.0 PB'
         >>> naturalsize(10**34 * 3)
         '30000.0 QB'
         >>> naturalsize(-4096, True)
         '-4.0 KiB'
+        >>> naturalsize(10**40 + 1)
+        '10000000000.0 QB'
+        >>> naturalsize(10**18 - 1)
+        '1000.0 PB'
 
         ```
 
@@ -76,6 +116,9 @@ def naturalsize(
 
     Returns:
         str: Human readable representation of a filesize.
+
+    Raises:
+        ValueError: If `value` is not a finite number.
     """
     if gnu:
         suffix = suffixes["gnu"]
@@ -85,8 +128,11 @@ def naturalsize(
         suffix = suffixes["decimal"]
 
     base = 1024 if (gnu or binary) else 1000
-    bytes_ = float(value)
+    bytes_ = _number_of_bytes(value)
     abs_bytes = abs(bytes_)
+    if not (isinstance(bytes_, int) or math.isfinite(bytes_)):
+        msg = "Cannot format a non-finite number of bytes"
+        raise ValueError(msg)
 
     if abs_bytes == 1 and not gnu:
         return f"{int(bytes_)} Byte"
@@ -94,6 +140,644 @@ def naturalsize(
     if abs_bytes < base:
         return f"{int(bytes_)}B" if gnu else f"{int(bytes_)} Bytes"
 
-    exp = int(min(log(abs_bytes, base), len(suffix)))
+    exp = _size_exponent(abs_bytes, base, len(suffix))
+    if isinstance(bytes_, int) and abs_bytes > 2**53:
+        precision = _fixed_point_precision(format)
+        if precision is not None:
+            return _format_quotient(bytes_, base**exp, precision) + suffix[exp - 1]
     ret: str = format % (bytes_ / (base**exp)) + suffix[exp - 1]
     return ret
+
+
+def _number_of_bytes(value: float | str) -> float:
+    """Return `value` as an int if it is integer-like, else as a float.
+
+    Integers, including NumPy ones, are kept exact, so that sizes beyond 2**53 bytes
+    are formatted the same whatever their type.
+    """
+    if isinstance(value, int):
+        return value
+    try:
+        return operator.index(value)  # type: ignore[arg-type]
+    except TypeError:
+        return float(value)
+
+
+def _size_exponent(abs_bytes: float, base: int, largest: int) -> int:
+    """Return the index of the suffix for `abs_bytes`, 0 if it is less than `base`."""
+    if not isinstance(abs_bytes, int):
+        return min(bisect_right(_thresholds[base], abs_bytes), largest)
+    if base == 1024:
+        return min(max(abs_bytes.bit_length() - 1, 0) // 10, largest)
+    return min(bisect_right(_int_thresholds[base], abs_bytes), largest)
+
+
+def naturalsize_column(
+    values: Iterable[float | str],
+    binary: bool = False,
+    gnu: bool = False,
+    format: str = "%.1f",
+    reference: float | str | None = None,
+) -> Any:
+    """Format a column of numbers of bytes sharing a single filesize unit.
+
+    Unlike `naturalsize`, which picks a unit for every value, the unit is chosen once
+    for the whole column: the one `naturalsize` would use for `reference`, by default
+    the largest absolute value of the column. Every value is then formatted with a
+    plain division, so the cells of a table line up.
+
+    Examples:
+        ```pycon
+        >>> naturalsize_column([900_000, 1_200_000, 0])
+        ['0.9 MB', '1.2 MB', '0.0 MB']
+        >>> naturalsize_column([3000, 300_000], True, reference=1024)
+        ['2.9 KiB', '293.0 KiB']
+        >>> naturalsize_column([1, 300], gnu=True)
+        ['1B', '300B']
+        >>> naturalsize_column([10**18 - 1, 10**17])
+        ['1000.0 PB', '100.0 PB']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Numbers of bytes. NumPy arrays are
+            accepted.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+        reference (int, float, str, None): Value whose unit is used for the column.
+            Defaults to the largest absolute value in `values`.
+
+    Returns:
+        list of str or numpy.ndarray: The formatted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+
+    Raises:
+        ValueError: If a value or `reference` is not a finite number.
+    """
+    if gnu:
+        suffix = suffixes["gnu"]
+    elif binary:
+        suffix = suffixes["binary"]
+    else:
+        suffix = suffixes["decimal"]
+
+    base = 1024 if (gnu or binary) else 1000
+    items, shape = _unpack_values(values)
+    # As in `naturalsize`, ints are kept exact
+    numbers = [_number_of_bytes(value) for value in items]
+    if reference is None:
+        abs_reference = max(map(abs, numbers), default=0.0)
+    else:
+        abs_reference = abs(_number_of_bytes(reference))
+    if not all(isinstance(n, int) or math.isfinite(n) for n in [abs_reference, *numbers]):
+        msg = "Cannot format a non-finite number of bytes"
+        raise ValueError(msg)
+
+    if abs_reference < base:
+        results = [naturalsize(value, binary, gnu, format) for value in numbers]
+        return _pack_results(results, shape)
+
+    exp = _size_exponent(abs_reference, base, len(suffix))
+    divisor = base**exp
+    unit = suffix[exp - 1]
+    precision = _fixed_point_precision(format)
+    results = []
+    for bytes_ in numbers:
+        if precision is not None and isinstance(bytes_, int) and abs(bytes_) > 2**53:
+            results.append(_format_quotient(bytes_, divisor, precision) + unit)
+        else:
+            results.append(format % (bytes_ / divisor) + unit)
+    return _pack_results(results, shape)
+
+
+def naturalsize_many(
+    values: Iterable[float | str],
+    binary: bool = False,
+    gnu: bool = False,
+    format: str = "%.1f",
+) -> Any:
+    """Format many numbers of bytes like human-readable filesizes (e.g. 10 kB).
+
+    This is the batch version of `naturalsize`. The suffix of every value is found
+    by a search in a precomputed table of thresholds, done for the whole array at
+    once with NumPy's `searchsorted` when a NumPy array is given.
+
+    Examples:
+        ```pycon
+        >>> naturalsize_many([1, 300, 3000, 3_000_000, -4096])
+        ['1 Byte', '300 Bytes', '3.0 kB', '3.0 MB', '-4.1 kB']
+        >>> naturalsize_many([1, 300, 3000], gnu=True, format="%.3f")
+        ['1B', '300B', '2.930K']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Numbers of bytes. NumPy arrays are
+            accepted.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+
+    Returns:
+        list of str or numpy.ndarray: The formatted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+
+    Raises:
+        ValueError: If a value is not a finite number.
+    """
+    if gnu:
+        suffix = suffixes["gnu"]
+    elif binary:
+        suffix = suffixes["binary"]
+    else:
+        suffix = suffixes["decimal"]
+
+    base = 1024 if (gnu or binary) else 1000
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray) and values.dtype.kind in "iu":
+        # Compare the magnitudes exactly, as uint64 (this also holds for -2**63)
+        shape = values.shape
+        array = values.ravel()
+        limits = [power for power in _int_thresholds[base] if power < 2**64]
+        magnitudes = numpy.abs(array).astype(numpy.uint64)
+        exps = numpy.searchsorted(numpy.array(limits, numpy.uint64), magnitudes, side="right")
+        numbers, exps = array.tolist(), exps.tolist()
+    elif numpy is not None and isinstance(values, numpy.ndarray):
+        shape = values.shape
+        thresholds = _thresholds[base]
+        array = values.astype(numpy.float64).ravel()
+        if not numpy.isfinite(array).all():
+            msg = "Cannot format a non-finite number of bytes"
+            raise ValueError(msg)
+        exps = numpy.searchsorted(thresholds, numpy.abs(array), side="right")
+        numbers, exps = array.tolist(), exps.tolist()
+    else:
+        items, shape = _unpack_values(values)
+        # As in `naturalsize`, ints are kept exact
+        numbers = [_number_of_bytes(value) for value in items]
+        if not all(isinstance(bytes_, int) or math.isfinite(bytes_) for bytes_ in numbers):
+            msg = "Cannot format a non-finite number of bytes"
+            raise ValueError(msg)
+        exps = [_size_exponent(abs(bytes_), base, len(suffix)) for bytes_ in numbers]
+
+    divisors = [base**exp for exp in range(len(suffix) + 1)]
+    precision = _fixed_point_precision(format)
+    results = []
+    for bytes_, exp in zip(numbers, exps):
+        if not exp:
+            if abs(bytes_) == 1 and not gnu:
+                results.append(f"{int(bytes_)} Byte")
+            else:
+                results.append(f"{int(bytes_)}B" if gnu else f"{int(bytes_)} Bytes")
+        elif precision is not None and isinstance(bytes_, int) and abs(bytes_) > 2**53:
+            results.append(_format_quotient(bytes_, divisors[exp], precision) + suffix[exp - 1])
+        else:
+            results.append(format % (bytes_ / divisors[exp]) + suffix[exp - 1])
+    return _pack_results(results, shape)
+
+
+def parse_size(text: str) -> int:
+    """Parse a human-readable filesize, e.g. "2.9 KiB", into a number of bytes.
+
+    This is the inverse of `naturalsize`. The decimal (kB, MB), binary (KiB, MiB) and
+    GNU (K, M) suffixes are all recognized in any case, as are "B", "Byte" and
+    "Bytes". Text without a suffix is read as a number of bytes. The number may have
+    an exponent, and use the decimal separator of the active locale as well as ".".
+    Since `naturalsize` rounds, the result is the exact value of the text, rounded to
+    the nearest byte.
+
+    Examples:
+        ```pycon
+        >>> parse_size("3.0 MB")
+        3000000
+        >>> parse_size("2.9 KiB")
+        2970
+        >>> parse_size("2.930K")
+        3000
+        >>> parse_size("300 Bytes")
+        300
+        >>> parse_size("-4.0 KiB")
+        -4096
+        >>> parse_size("1.0 QiB")
+        1267650600228229401496703205376
+        >>> parse_size("1 KB"), parse_size(".5 mb"), parse_size("1e3")
+        (1000, 500000, 1000)
+        >>> parse_size("lots")
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot parse 'lots' as a filesize
+        >>> parse_size("1.5")
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot parse '1.5' as a whole number of bytes
+        >>> parse_size("1e200000000")
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot parse '1e200000000' as a filesize, its exponent is too large
+        >>> parse_size("1e-200000000 KB")
+        0
+
+        ```
+
+    Args:
+        text (str): Text to parse.
+
+    Returns:
+        int: Number of bytes.
+
+    Raises:
+        ValueError: If `text` is not a number optionally followed by a size suffix, is
+            a fraction of a byte, or has an exponent above 4300.
+    """
+    return _size_parser(decimal_separator())(text)
+
+
+def parse_size_many(texts: Iterable[str]) -> list[int]:
+    """Parse many human-readable filesizes into numbers of bytes.
+
+    This is the batch version of `parse_size`, e.g. for a field of a log file.
+
+    Examples:
+        ```pycon
+        >>> parse_size_many(["2.9 KiB", "3.0 MB", "2.9K", "1 Byte"])
+        [2970, 3000000, 2970, 1]
+
+        ```
+
+    Args:
+        texts (iterable of str): Texts to parse.
+
+    Returns:
+        list of int: Numbers of bytes, in the same order.
+
+    Raises:
+        ValueError: If a text is not a number optionally followed by a size suffix, is
+            a fraction of a byte, or has an exponent above 4300.
+    """
+    parse = _size_parser(decimal_separator())
+    return [parse(text) for text in texts]
+
+
+@lru_cache(maxsize=None)
+def _size_parser(decimal_sep: str) -> Callable[[str], int]:
+    """Build the parser of `naturalsize` output from the `suffixes` table.
+
+    This is done once per decimal separator, which is accepted as well as ".".
+    """
+    import re
+
+    # Units are matched in any case. The lower case suffixes are all distinct.
+    multipliers = {"b": 1, "byte": 1, "bytes": 1}
+    for exp, (decimal, binary, gnu) in enumerate(
+        zip(suffixes["decimal"], suffixes["binary"], suffixes["gnu"]), 1
+    ):
+        multipliers[decimal.strip().lower()] = 1000**exp
+        multipliers[binary.strip().lower()] = 1024**exp
+        multipliers[gnu.lower()] = 1024**exp
+
+    units = "|".join(map(re.escape, sorted(multipliers, key=len, reverse=True)))
+    point = re.escape("." + decimal_sep) if decimal_sep != "." else re.escape(".")
+    pattern = re.compile(
+        rf"\s*([-+]?)(?=[{point}]?\d)(\d*)(?:[{point}](\d*))?(?:e([-+]?\d+))?"
+        rf"\s*({units})?\s*",
+        re.IGNORECASE,
+    )
+
+    def parse(text: str) -> int:
+        match = pattern.fullmatch(text)
+        if match is None:
+            msg = f"Cannot parse {text!r} as a filesize"
+            raise ValueError(msg)
+        sign, whole, fraction, exponent, unit = match.groups()
+        fraction = fraction or ""
+        unit = unit.lower() if unit else "b"
+        # The exact value is `numerator / denominator` bytes
+        numerator = int(whole + fraction or "0") * multipliers[unit]
+        denominator = 10 ** len(fraction)
+        exponent = int(exponent or 0)
+        if exponent > _MAX_SIZE_EXPONENT:
+            msg = f"Cannot parse {text!r} as a filesize, its exponent is too large"
+            raise ValueError(msg)
+        # Below this exponent the size is under 0.1 byte whatever the exponent is, so
+        # it is rounded in the same way without computing a huge power of 10
+        exponent = max(exponent, -(numerator.bit_length() // 3 + 2))
+        if exponent > 0:
+            numerator *= 10**exponent
+        else:
+            denominator *= 10**-exponent
+
+        bytes_, remainder = divmod(numerator, denominator)
+        if remainder and multipliers[unit] == 1:
+            # Only sizes in units larger than a byte are rounded
+            msg = f"Cannot parse {text!r} as a whole number of bytes"
+            raise ValueError(msg)
+        if unit == "byte" and numerator != denominator:
+            msg = f"Cannot parse {text!r} as a filesize"  # "Byte" is singular
+            raise ValueError(msg)
+        if 2 * remainder > denominator or (2 * remainder == denominator and bytes_ % 2):
+            bytes_ += 1  # Round half to even
+        return -bytes_ if sign == "-" else bytes_
+
+    return parse
+
+
+def directory_sizes(
+    path: str | os.PathLike[str],
+    workers: int | None = None,
+    follow_symlinks: bool = False,
+    onerror: Callable[[OSError], object] | None = None,
+) -> Iterator[tuple[str, int]]:
+    """Compute the total size of every directory of a tree, like `du`.
+
+    Directories are read with `os.scandir` by a pool of threads, so that the I/O of
+    several directories overlaps. The size of a directory is the sum of the apparent
+    sizes (`st_size`) of the files below it. Each directory is yielded as soon as its
+    whole subtree has been read, so results stream in while the scan goes on: a
+    directory always comes after its subdirectories, and `path` itself comes last.
+
+    Like `du`, a file with several hard links in the tree is counted once. When
+    following symbolic links, so is a directory reached by several paths, which also
+    keeps links pointing back up the tree from being followed forever.
+
+    The sizes are plain numbers of bytes, ready to be formatted with `naturalsize`:
+
+    ```python
+    for directory, size in directory_sizes("/var/log"):
+        print(naturalsize(size, gnu=True), directory)
+    ```
+
+    Args:
+        path (str, os.PathLike): Root of the tree to scan.
+        workers (int, None): Number of threads. If `None`, the default of
+            `concurrent.futures.ThreadPoolExecutor` is used.
+        follow_symlinks (bool): If `True`, symbolic links to directories are scanned
+            and symbolic links to files count the size of their target.
+        onerror (callable, None): Called with the `OSError` raised when a directory or
+            a file cannot be read, as for `os.walk`. By default errors are ignored and
+            the entry counts as empty.
+
+    Yields:
+        tuple of str and int: The path of a directory and its total size in bytes.
+    """
+    import queue
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    results: queue.SimpleQueue[
+        tuple[_Directory, int, list[str], list[OSError]] | BaseException
+    ]
+    results = queue.SimpleQueue()
+    stopped = threading.Event()
+
+    def scan(directory: _Directory) -> None:
+        if stopped.is_set():
+            return
+        try:
+            total, subdirs, errors = _scan_directory(
+                directory.path, follow_symlinks, inodes
+            )
+        except BaseException as error:  # noqa: BLE001
+            # Hand the error to the consumer, which would wait for a result forever
+            results.put(error)
+        else:
+            results.put((directory, total, subdirs, errors))
+
+    inodes = _Inodes()
+    if follow_symlinks:
+        try:
+            inodes.add(os.stat(path))
+        except OSError:
+            pass  # Reported when the directory is read
+    executor = ThreadPoolExecutor(workers)
+    try:
+        executor.submit(scan, _Directory(os.fspath(path), None))
+        outstanding = 1
+        while outstanding:
+            result = results.get()
+            if isinstance(result, BaseException):
+                raise result
+            directory, total, subdirs, errors = result
+            outstanding -= 1
+            if onerror is not None:
+                for error in errors:
+                    onerror(error)
+            directory.total += total
+            directory.pending += len(subdirs)
+            for subdir in subdirs:
+                executor.submit(scan, _Directory(subdir, directory))
+            outstanding += len(subdirs)
+
+            # Fold every finished directory into its parent, up to an unfinished one
+            while directory.pending == 0:
+                yield directory.path, directory.total
+                parent = directory.parent
+                if parent is None:
+                    break
+                parent.total += directory.total
+                parent.pending -= 1
+                directory = parent
+    finally:
+        # Let queued scans return at once if the consumer stops early
+        stopped.set()
+        executor.shutdown(wait=False)
+
+
+class _Directory:
+    """A directory being scanned by `directory_sizes`."""
+
+    __slots__ = ("parent", "path", "pending", "total")
+
+    def __init__(self, path: str, parent: _Directory | None) -> None:
+        self.path = path
+        self.parent = parent
+        self.total = 0
+        self.pending = 0
+
+
+class _Inodes:
+    """The inodes already counted by `directory_sizes`, shared by its threads."""
+
+    __slots__ = ("_keys", "_lock")
+
+    def __init__(self) -> None:
+        import threading
+
+        self._keys: set[tuple[int, int]] = set()
+        self._lock = threading.Lock()
+
+    def add(self, stat: os.stat_result) -> bool:
+        """Add the inode of `stat`, and return whether it was not counted before."""
+        if not stat.st_ino:
+            return True  # Unknown, as for `os.DirEntry.stat` on Windows
+        key = (stat.st_dev, stat.st_ino)
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+
+def _scan_directory(
+    path: str, follow_symlinks: bool, inodes: _Inodes
+) -> tuple[int, list[str], list[OSError]]:
+    """Return the size of the files directly in `path`, its subdirectories and errors.
+
+    Files with several hard links, and directories if `follow_symlinks` is true, are
+    skipped if their inode is already in `inodes`.
+    """
+    total = 0
+    subdirs = []
+    errors = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        if not follow_symlinks or inodes.add(entry.stat()):
+                            subdirs.append(entry.path)
+                        continue
+                    stat = entry.stat(follow_symlinks=follow_symlinks)
+                    if stat.st_nlink <= 1 or inodes.add(stat):
+                        total += stat.st_size
+                except OSError as error:
+                    errors.append(error)
+    except OSError as error:
+        errors.append(error)
+    return total, subdirs, errors
+
+
+class RateMeter:
+    """Measure the throughput of a transfer and describe it as text.
+
+    `update` only adds a byte count and reads the clock, so it can be called for
+    every chunk of a copy loop. Once per `interval` seconds, the bytes received since
+    the last sample give a new throughput, smoothed with an exponentially weighted
+    moving average, and the text is rendered with `naturalsize` and `naturaldelta`,
+    e.g. "12.3 MB/s, 4 minutes left". The cost of formatting therefore does not
+    depend on the number of updates.
+
+    Examples:
+        ```pycon
+        >>> ticks = iter([0.0, 0.5, 1.0, 2.0, 3.0])
+        >>> meter = RateMeter(total=10_000_000, clock=lambda: next(ticks))
+        >>> meter.update(1_000_000) is None  # Less than an interval has passed
+        True
+        >>> meter.update(1_000_000)
+        '2.0 MB/s, 4 seconds left'
+        >>> meter.update(2_000_000)
+        '2.0 MB/s, 3 seconds left'
+        >>> meter.update(0)  # A stalled second only pulls the average down
+        '1.4 MB/s, 4 seconds left'
+        >>> meter.done, meter.text
+        (4000000, '1.4 MB/s, 4 seconds left')
+
+        Once a stalled transfer would take more than a year, the time left is unknown:
+
+        >>> ticks = iter(range(100))
+        >>> meter = RateMeter(total=10**10, clock=lambda: next(ticks))
+        >>> meter.update(1_000_000)
+        '1.0 MB/s, 3 hours left'
+        >>> for _ in range(30):
+        ...     _ = meter.update(0)
+        >>> meter.text, meter.eta
+        ('22 Bytes/s', None)
+
+        ```
+
+    Args:
+        total (int, None): Expected number of bytes, if known, to estimate the time
+            left.
+        interval (float): Minimum number of seconds between two samples.
+        smoothing (float): Weight of the newest sample in the moving average, between
+            0 and 1. Higher values follow changes of throughput faster.
+        binary (bool): If `True`, uses binary suffixes (KiB/s, MiB/s).
+        gnu (bool): If `True`, uses GNU-style suffixes (K/s, M/s).
+        format (str): Custom formatter of the throughput.
+        clock (callable): Function returning the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        total: int | None = None,
+        interval: float = 1.0,
+        smoothing: float = 0.3,
+        binary: bool = False,
+        gnu: bool = False,
+        format: str = "%.1f",
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.total = total
+        self.interval = interval
+        self.smoothing = smoothing
+        self.binary = binary
+        self.gnu = gnu
+        self.format = format
+        self.clock = clock
+        self.done = 0
+        self.rate: float | None = None
+        self._text: str | None = None
+        self._sampled = 0
+        self._sampled_at = clock()
+
+    def update(self, nbytes: int) -> str | None:
+        """Record that `nbytes` more bytes were transferred.
+
+        Args:
+            nbytes (int): Number of bytes transferred since the previous update.
+
+        Returns:
+            str or None: The new text if a sample was taken and the text changed,
+                otherwise `None`.
+        """
+        self.done += nbytes
+        now = self.clock()
+        if now - self._sampled_at < self.interval:
+            return None
+        previous = self._text
+        self._sample(now)
+        return None if self._text == previous else self._text
+
+    def _sample(self, now: float) -> None:
+        elapsed = now - self._sampled_at
+        if elapsed > 0:
+            rate = (self.done - self._sampled) / elapsed
+            if self.rate is None:
+                self.rate = rate
+            else:
+                self.rate += self.smoothing * (rate - self.rate)
+        self._sampled = self.done
+        self._sampled_at = now
+        self._text = self._render()
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated number of seconds left, or `None` if it cannot be estimated.
+
+        The time left is not estimated beyond a year, which only happens when the
+        transfer has all but stalled: the moving average then never reaches 0, and
+        the estimate would grow until `naturaldelta` cannot format it.
+        """
+        if self.total is None or not self.rate:
+            return None
+        eta = max(self.total - self.done, 0) / self.rate
+        return eta if eta <= _MAX_ETA else None
+
+    @property
+    def text(self) -> str:
+        """Description of the throughput and time left, as of the latest sample."""
+        if self._text is None:
+            self._text = self._render()
+        return self._text
+
+    def _render(self) -> str:
+        rate = naturalsize(self.rate or 0, self.binary, self.gnu, self.format)
+        text = _("%s/s") % rate
+        eta = self.eta
+        if eta is not None:
+            text = _("%s, %s left") % (text, naturaldelta(eta))
+        return text
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import gettext as gettext_module
+from contextlib import contextmanager
 from threading import local
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     import os
     import pathlib
+    from collections.abc import Iterator
 
 __all__ = ["activate", "deactivate", "decimal_separator", "thousands_separator"]
 
@@ -49,10 +51,8 @@ def _get_default_locale_path() -> pathlib.Path | None:
 
 
 def get_translation() -> gettext_module.NullTranslations:
-    try:
-        return _TRANSLATIONS[_CURRENT.locale]
-    except (AttributeError, KeyError):
-        return _TRANSLATIONS[None]
+    translation = _TRANSLATIONS.get(getattr(_CURRENT, "locale", None))
+    return _TRANSLATIONS[None] if translation is None else translation
 
 
 def activate(
@@ -98,6 +98,26 @@ def deactivate() -> None:
     _CURRENT.locale = None
 
 
+def _current_locale() -> str | None:
+    """Return the name of the active locale, or `None` if no translation is active."""
+    return getattr(_CURRENT, "locale", None)
+
+
+@contextmanager
+def _use_locale(locale: str | None) -> Iterator[None]:
+    """Temporarily activate `locale`, restoring the previous locale on exit.
+
+    Args:
+        locale (str | None): Language name, e.g. `en_GB`, or `None` for no translation.
+    """
+    previous = _current_locale()
+    activate(locale)
+    try:
+        yield
+    finally:
+        _CURRENT.locale = previous
+
+
 def _gettext(message: str) -> str:
     """Get translation.
 
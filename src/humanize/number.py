@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import bisect
+import math
+import operator
+import sys
+from decimal import Decimal
+from functools import lru_cache, partial
 
+from .i18n import _current_locale, _use_locale, get_translation
 from .i18n import _gettext as _
 from .i18n import _ngettext, decimal_separator, thousands_separator
 from .i18n import _ngettext_noop as NS_
@@ -11,7 +17,8 @@ from .i18n import _pgettext as P_
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from typing import TypeAlias
+    from collections.abc import Callable, Iterable
+    from typing import Any, TypeAlias
 
     # This type can be better defined by typing.SupportsFloat
     # but that's a Python 3.8 only typing option.
@@ -20,8 +27,6 @@ if TYPE_CHECKING:
 
 def _format_not_finite(value: float) -> str:
     """Utility function to handle infinite and nan cases."""
-    import math
-
     if math.isnan(value):
         return "NaN"
     if math.isinf(value) and value < 0:
@@ -31,6 +36,126 @@ def _format_not_finite(value: float) -> str:
     return ""
 
 
+def _int_or_text(value: Any) -> int | str:
+    """Coerce `value` to an int, or return its final text if that is not possible.
+
+    This is the input coercion of the functions that work on integers. The result is
+    `int(value)` for finite numbers and numeric strings, `NaN`, `+Inf` or `-Inf` for
+    non-finite ones, and `str(value)` for anything else. Common types are dispatched
+    first so that an `int` costs a single type check and nothing goes through `float`
+    unless needed.
+
+    >>> _int_or_text(12), _int_or_text(12.7), _int_or_text("12"), _int_or_text("inf")
+    (12, 12, 12, '+Inf')
+    >>> _int_or_text("1.5"), _int_or_text(None)
+    ('1.5', 'None')
+    """
+    value_type = type(value)
+    if value_type is int:
+        return value
+    try:
+        if value_type is float:
+            return int(value) if math.isfinite(value) else _format_not_finite(value)
+        if value_type is str:
+            try:
+                return int(value)
+            except ValueError:
+                # Not an integer, but may still be "inf" or "nan"
+                number = float(value)
+                if not math.isfinite(number):
+                    return _format_not_finite(number)
+                raise
+        if isinstance(value, Decimal):
+            if value.is_finite():
+                return int(value)
+            return _format_not_finite(float(value))
+        if hasattr(value, "__index__"):
+            # int subclasses and integer-like scalars such as NumPy's
+            try:
+                return operator.index(value)
+            except TypeError:
+                pass  # NumPy's bool_, whose `__index__` raises, is converted below
+        number = float(value)
+        if not math.isfinite(number):
+            return _format_not_finite(number)
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _float_or_text(value: Any) -> float | str:
+    """Coerce `value` to a finite float, or return its final text if that fails.
+
+    The float counterpart of `_int_or_text`: non-finite numbers give `NaN`, `+Inf` or
+    `-Inf`, and values that cannot be converted give `str(value)`.
+
+    >>> _float_or_text(2), _float_or_text("0.5"), _float_or_text("-inf")
+    (2.0, 0.5, '-Inf')
+    """
+    try:
+        number = value if type(value) is float else float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if not math.isfinite(number):
+        return _format_not_finite(number)
+    return number
+
+
+def _exponent(value: float | Decimal, base: int = 10) -> int:
+    """Return the exponent of the leading digit of a non-zero finite number.
+
+    This is `floor(log(abs(value), base))` for a base of 10 or 2, computed without
+    rounding errors: from the digit count of a `Decimal`, the bit length of an `int`,
+    the binary exponent of a `float`, and otherwise from a base 10 log corrected by
+    comparing with the powers of ten around it. Exact powers such as 1000 or 10**15
+    are never misclassified. A float is compared with the float closest to the power
+    of ten, so that `1e-14` has an exponent of -14, like its literal.
+
+    >>> _exponent(1000), _exponent(999), _exponent(0.001), _exponent(10**23 - 1)
+    (3, 2, -3, 22)
+    >>> _exponent(1024, 2), _exponent(1023.5, 2)
+    (10, 9)
+    """
+    if base == 2:
+        if isinstance(value, int):
+            return abs(value).bit_length() - 1
+        return math.frexp(value)[1] - 1
+    if isinstance(value, Decimal):
+        return value.adjusted()
+
+    magnitude = abs(value)
+    log = math.log10(magnitude)
+    exponent = math.floor(log)
+    if 1e-9 < log - exponent < 1 - 1e-9:
+        return exponent
+    # The log may be one off next to a power of ten, so check against it.
+    if _is_below_power_of_ten(magnitude, exponent):
+        exponent -= 1
+    elif not _is_below_power_of_ten(magnitude, exponent + 1):
+        exponent += 1
+    return exponent
+
+
+def _is_below_power_of_ten(magnitude: float, exponent: int) -> bool:
+    """Return whether `magnitude < 10**exponent`.
+
+    Floats are compared with the float closest to the power of ten, anything else
+    exactly.
+    """
+    if isinstance(magnitude, float):
+        return magnitude < _float_power_of_ten(exponent)
+    if exponent >= 0:
+        return magnitude < 10**exponent
+    numerator, denominator = magnitude.as_integer_ratio()
+    return numerator * 10**-exponent < denominator
+
+
+@lru_cache(maxsize=None)
+def _float_power_of_ten(exponent: int) -> float:
+    """Return the float closest to `10**exponent`."""
+    return float(f"1e{exponent}")
+
+
 def ordinal(value: NumberOrString, gender: str = "male") -> str:
     """Converts an integer to its ordinal as a string.
 
@@ -68,16 +193,13 @@ def ordinal(value: NumberOrString, gender: str = "male") -> str:
     Returns:
         str: Ordinal string.
     """
-    import math
+    return _ordinal(value, _ordinal_suffixes(gender))
 
-    try:
-        if not math.isfinite(float(value)):
-            return _format_not_finite(float(value))
-        value = int(value)
-    except (TypeError, ValueError):
-        return str(value)
+
+def _ordinal_suffixes(gender: str) -> tuple[str, ...]:
+    """Return the translated ordinal suffixes, indexed by the last digit."""
     if gender == "male":
-        t = (
+        return (
             P_("0 (male)", "th"),
             P_("1 (male)", "st"),
             P_("2 (male)", "nd"),
@@ -90,7 +212,7 @@ def ordinal(value: NumberOrString, gender: str = "male") -> str:
             P_("9 (male)", "th"),
         )
     else:
-        t = (
+        return (
             P_("0 (female)", "th"),
             P_("1 (female)", "st"),
             P_("2 (female)", "nd"),
@@ -102,9 +224,16 @@ def ordinal(value: NumberOrString, gender: str = "male") -> str:
             P_("8 (female)", "th"),
             P_("9 (female)", "th"),
         )
+
+
+def _ordinal(value: NumberOrString, suffixes: tuple[str, ...]) -> str:
+    """Implementation of `ordinal` with the suffixes already translated."""
+    value = _int_or_text(value)
+    if isinstance(value, str):
+        return value
     if value % 100 in (11, 12, 13):  # special case
-        return f"{value}{t[0]}"
-    return f"{value}{t[value % 10]}"
+        return f"{value}{suffixes[0]}"
+    return f"{value}{suffixes[value % 10]}"
 
 
 def intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
@@ -129,8 +258,15 @@ def intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
         '14,308.4'
         >>> intcomma("14308.40", 1)
         '14,308.4'
+        >>> from decimal import Decimal
+        >>> intcomma(Decimal("12345678901234567890.25"))
+        '12,345,678,901,234,567,890.25'
         >>> intcomma(None)
         'None'
+        >>> intcomma(10**5003)[:11], len(intcomma(10**5003))
+        ('100,000,000', 6671)
+        >>> intcomma("9" * 5000 + ".25")[-12:]
+        '9,999,999.25'
 
         ```
 
@@ -141,38 +277,168 @@ def intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
     Returns:
         str: String containing commas every three digits.
     """
-    import math
+    return _intcomma(value, ndigits, thousands_separator(), decimal_separator())
 
-    thousands_sep = thousands_separator()
-    decimal_sep = decimal_separator()
+
+def _intcomma(
+    value: NumberOrString,
+    ndigits: int | None,
+    thousands_sep: str,
+    decimal_sep: str,
+) -> str:
+    """Implementation of `intcomma` with the locale separators already resolved."""
+    number: float | Decimal
     try:
         if isinstance(value, str):
             value = value.replace(thousands_sep, "").replace(decimal_sep, ".")
-            if not math.isfinite(float(value)):
-                return _format_not_finite(float(value))
-            if "." in value:
-                value = float(value)
-            else:
-                value = int(value)
+            number = _parse_number(value)
+            if type(number) is float and math.isfinite(number) and "." not in value:
+                return value  # Such as "1e3", which is neither an int nor has a decimal
         else:
-            if not math.isfinite(float(value)):
-                return _format_not_finite(float(value))
-            float(value)
+            number = value
+        if isinstance(number, Decimal):
+            if not number.is_finite():
+                return _format_not_finite(float(number))
+        elif isinstance(number, int):
+            if number.bit_length() > _LONG_INT_BITS:
+                number = Decimal(number)
+        elif not math.isfinite(float(number)):
+            return _format_not_finite(float(number))
     except (TypeError, ValueError):
         return str(value)
 
-    if ndigits is not None:
-        orig = "{0:.{1}f}".format(value, ndigits)
+    # ints and Decimals are formatted from their exact digits, never through a float.
+    if ndigits is None:
+        orig = format(number, "f") if isinstance(number, Decimal) else str(number)
+    elif type(number) is int and ndigits >= 0:
+        orig = f"{number}.{'0' * ndigits}" if ndigits else str(number)
     else:
-        orig = str(value)
-    orig = orig.replace(".", decimal_sep)
-    import re
+        orig = "{0:.{1}f}".format(number, ndigits)
+    return _group_thousands(orig.replace(".", decimal_sep), thousands_sep)
 
-    while True:
-        new = re.sub(r"^(-?\d+)(\d{3})", rf"\g<1>{thousands_sep}\g<2>", orig)
-        if orig == new:
-            return new
-        orig = new
+
+# ints longer than this many bits go through Decimal: `str` refuses ints of more than
+# 4300 digits (about 14,284 bits) by default, see `sys.set_int_max_str_digits`
+_LONG_INT_BITS = 14_000
+
+
+def _parse_number(text: str) -> int | float | Decimal:
+    """Parse a numeric string without losing any of its digits.
+
+    Integer strings give an int and other numbers a float, like `int` and `float`
+    would. If the float does not hold the exact value written in `text`, because it
+    has too many digits or overflows to infinity, or if the integer is too long for
+    `int`, the exact `Decimal` is returned instead.
+
+    >>> _parse_number("12"), _parse_number("1.5"), _parse_number("inf")
+    (12, 1.5, inf)
+    >>> _parse_number("0.1000000000000000055511")
+    Decimal('0.1000000000000000055511')
+    >>> len(str(_parse_number("9" * 5000 + ".25")))
+    5003
+
+    Raises:
+        ValueError: If `text` is not a number.
+    """
+    if "." not in text:
+        try:
+            return int(text)
+        except ValueError:
+            pass
+    number = float(text)
+    if math.isnan(number):
+        return number
+    try:
+        exact = Decimal(text)
+    except ArithmeticError:
+        return number
+    return number if Decimal(repr(number)) == exact else exact
+
+
+def _group_thousands(number: str, sep: str) -> str:
+    """Insert `sep` every three digits into the leading run of digits of `number`.
+
+    Only the integer part is grouped: an optional minus sign followed by digits. The
+    rest of the string (decimal part, exponent) is kept as is. This works in a single
+    pass, so the cost is linear in the length of `number`.
+
+    >>> _group_thousands("-1234567.891", ",")
+    '-1,234,567.891'
+    >>> _group_thousands("123", ",")
+    '123'
+    """
+    start = 1 if number.startswith("-") else 0
+    tail = number[start:].lstrip("0123456789")
+    end = len(number) - len(tail)
+    if end - start <= 3:
+        return number
+    head = start + ((end - start) % 3 or 3)
+    groups = [number[start:head]]
+    groups.extend([number[i : i + 3] for i in range(head, end, 3)])
+    return number[:start] + sep.join(groups) + tail
+
+
+def intcomma_many(values: Iterable[NumberOrString], ndigits: int | None = None) -> Any:
+    """Converts many numbers to strings containing commas every three digits.
+
+    This is the batch version of `intcomma`: the locale separators are looked up once
+    for the whole batch instead of once per value. Any iterable is accepted, including
+    generators and NumPy arrays.
+
+    Examples:
+        ```pycon
+        >>> intcomma_many([100, 1000, "1000000", 1_234_567.25])
+        ['100', '1,000', '1,000,000', '1,234,567.25']
+        >>> intcomma_many((x * 1000 for x in range(3)), 1)
+        ['0.0', '1,000.0', '2,000.0']
+        >>> intcomma_many([None, float("nan")])
+        ['None', 'NaN']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Integers or floats to convert.
+        ndigits (int, None): Digits of precision for rounding after the decimal point.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+    """
+    thousands_sep = thousands_separator()
+    decimal_sep = decimal_separator()
+    items, shape = _unpack_values(values)
+    return _pack_results(
+        [_intcomma(value, ndigits, thousands_sep, decimal_sep) for value in items],
+        shape,
+    )
+
+
+def _unpack_values(values: Iterable[Any]) -> tuple[Iterable[Any], Any]:
+    """Prepare the input of a batch function for a plain Python loop.
+
+    NumPy arrays are flattened and, for dtypes whose Python equivalent formats the
+    same way, converted to Python scalars in one go with `tolist()`. Their shape is
+    returned so that the results can be given back as an array of the same shape.
+    Other iterables are passed through unchanged with a shape of `None`.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None or not isinstance(values, numpy.ndarray):
+        return values, None
+    flat = values.ravel()
+    if flat.dtype.kind in "biu" or flat.dtype == numpy.float64:
+        return flat.tolist(), values.shape
+    return list(flat), values.shape
+
+
+def _pack_results(results: list[str], shape: Any) -> Any:
+    """Return the results of a batch function in the container matching its input."""
+    if shape is None:
+        return results
+    import numpy
+
+    packed = numpy.empty(len(results), dtype=object)
+    packed[:] = results
+    return packed.reshape(shape)
 
 
 powers = [10**x for x in (3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 100)]
@@ -211,6 +477,8 @@ def intword(value: NumberOrString, format: str = "%.1f") -> str:
         '1.2 billion'
         >>> intword(8100000000000000000000000000000000)
         '8.1 decillion'
+        >>> intword(10**120)
+        '100000000000000000000.0 googol'
         >>> intword(None)
         'None'
         >>> intword("1234000", "%0.3f")
@@ -227,14 +495,19 @@ def intword(value: NumberOrString, format: str = "%.1f") -> str:
         str: Friendly text representation as a string, unless the value passed could not
             be coaxed into an `int`.
     """
-    import math
+    return _intword(value, format, _ngettext, decimal_separator())
 
-    try:
-        if not math.isfinite(float(value)):
-            return _format_not_finite(float(value))
-        value = int(value)
-    except (TypeError, ValueError):
-        return str(value)
+
+def _intword(
+    value: NumberOrString,
+    format: str,
+    ngettext: Callable[[str, str, int], str],
+    decimal_sep: str,
+) -> str:
+    """Implementation of `intword` with the translation function already resolved."""
+    value = _int_or_text(value)
+    if isinstance(value, str):
+        return value
 
     if value < 0:
         value *= -1
@@ -246,24 +519,391 @@ def intword(value: NumberOrString, format: str = "%.1f") -> str:
         return f"{negative_prefix}{value}"
 
     ordinal = bisect.bisect_right(powers, value)
+    return negative_prefix + _scale_intword(
+        value, ordinal, format, ngettext, decimal_sep
+    )
+
+
+def _scale_intword(
+    value: int,
+    ordinal: int,
+    format: str,
+    ngettext: Callable[[str, str, int], str],
+    decimal_sep: str,
+) -> str:
+    """Format a non-negative `value` given its insertion point in `powers`."""
     largest_ordinal = ordinal == len(powers)
 
     # Consider the biggest power of 10 that is smaller than value
     ordinal -= 1
     power = powers[ordinal]
-    chopped = value / power
-    rounded_value = float(format % chopped)
+    spec = _fixed_point_spec(format) if value > 2**53 else None
+    if spec is None:
+        chopped = value / power
+        rounded_value = float(format % chopped)
+
+        if not largest_ordinal and rounded_value * power == powers[ordinal + 1]:
+            # After rounding, we end up just at the next power
+            ordinal += 1
+            rounded_value = 1.0
+
+        count = math.ceil(rounded_value)
+        number = format % rounded_value
+    else:
+        # Beyond 2**53 a float cannot hold `value` exactly, and beyond ~10**308 the
+        # division overflows, so divide and round as a Decimal instead.
+        number = _format_exact_quotient(value, power, spec)
+        rounded = Decimal(number)
+
+        if not largest_ordinal and rounded == powers[ordinal + 1] // power:
+            # After rounding, we end up just at the next power
+            ordinal += 1
+            rounded = Decimal(1)
+            number = format % 1.0
 
-    if not largest_ordinal and rounded_value * power == powers[ordinal + 1]:
-        # After rounding, we end up just at the next power
-        ordinal += 1
-        rounded_value = 1.0
+        count = math.ceil(rounded)
 
     singular, plural = human_powers[ordinal]
-    unit = _ngettext(singular, plural, math.ceil(rounded_value))
+    unit = ngettext(singular, plural, count)
+    return f"{number.replace('.', decimal_sep)} {unit}"
+
+
+@lru_cache(maxsize=None)
+def _fixed_point_spec(format: str) -> str | None:
+    """Return the `format()` spec of a printf-style `%f` format, or `None`.
+
+    The spec formats a Decimal exactly as the printf-style format would format the
+    same number, for the flags a Decimal supports. `None` is returned for any other
+    format, which is then applied to a float.
+
+    >>> _fixed_point_spec("%5.1f"), _fixed_point_spec("%-+8f"), _fixed_point_spec("%.0F")
+    ('5.1f', '<+8.6f', '.0F')
+    >>> _fixed_point_spec("%#.1f") is None, _fixed_point_spec("%.1e") is None
+    (True, True)
+    """
+    import re
+
+    match = re.fullmatch(r"%([-+ 0]*)(\d*)(?:\.(\d*))?([fF])", format)
+    if match is None:
+        return None
+    flags, width, precision, type = match.groups()
+    align = "<" if "-" in flags else ""
+    sign = "+" if "+" in flags else " " if " " in flags else ""
+    zero = "0" if "0" in flags and not align else ""
+    precision = int(precision or 0) if precision is not None else 6
+    return f"{align}{sign}{zero}{width}.{precision}{type}"
+
+
+def _format_exact_quotient(value: int, power: int, spec: str) -> str:
+    """Format `value / power` with `spec`, without rounding before the last digit.
+
+    >>> _format_exact_quotient(10**400 + 25 * 10**98, 10**100, "5.1f")[-6:]
+    '0000.2'
+    """
+    sign, digits, _ = Decimal(value).as_tuple()
+    # `power` is a power of ten, so the quotient only moves the decimal point
+    return format(Decimal((sign, digits, -_exponent(power))), spec)
+
+
+@lru_cache(maxsize=None)
+def _fixed_point_precision(format: str) -> int | None:
+    """Return the precision of a plain `%.Nf` format, or `None` for other formats.
+
+    >>> _fixed_point_precision("%0.3f"), _fixed_point_precision("%f")
+    (3, 6)
+    >>> _fixed_point_precision("%5.1f") is None
+    True
+    """
+    import re
+
+    match = re.fullmatch(r"%0?(\.(\d*))?f", format)
+    if match is None:
+        return None
+    if match[1] is None:
+        return 6
+    return int(match[2] or 0)
+
+
+def _format_quotient(value: int, divisor: int, precision: int) -> str:
+    """Format `value / divisor` with `precision` decimals using ints only.
+
+    >>> _format_quotient(-(10**400 + 5 * 10**397), 10**399, 2)
+    '-10.05'
+    """
+    scale = 10**precision
+    rounded, remainder = divmod(abs(value) * scale, divisor)
+    if 2 * remainder > divisor or (2 * remainder == divisor and rounded % 2):
+        rounded += 1  # Round half to even, like printf-style formatting
+    whole, fraction = divmod(rounded, scale)
+    sign = "-" if value < 0 else ""
+    return f"{sign}{whole}.{fraction:0{precision}d}" if precision else f"{sign}{whole}"
+
+
+def _divide_intword(value: int, power: int, format: str) -> str:
+    """Format `value / power` with `format` for a non-negative int `value`.
+
+    As in `intword`, a `%f` format is applied to an exact Decimal beyond 2**53, where
+    a float no longer holds `value` exactly. Other formats, such as `%e`, always go
+    through a float, so they overflow beyond ~10**308 times `power`.
+    """
+    spec = _fixed_point_spec(format) if value > 2**53 else None
+    if spec is None:
+        return format % (value / power)
+    return _format_exact_quotient(value, power, spec)
+
+
+def intword_many(values: Iterable[NumberOrString], format: str = "%.1f") -> Any:
+    """Converts many large integers to a friendly text representation.
+
+    This is the batch version of `intword`. The position of every value in the table
+    of powers is found for the whole batch at once, with NumPy's `searchsorted` if
+    NumPy is in use, and each localized unit word is looked up only once per batch.
+
+    Examples:
+        ```pycon
+        >>> intword_many(["100", 12_400, 1_000_000, -1_200_000_000, None])
+        ['100', '12.4 thousand', '1.0 million', '-1.2 billion', 'None']
+        >>> intword_many([999_999, 1_234_000], "%0.3f")
+        ['999.999 thousand', '1.234 million']
+        >>> intword_many([999_999])
+        ['1.0 million']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Integers to convert. NumPy arrays are
+            accepted.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+    """
+    # The plural form of a unit only depends on the power and the rounded count, so
+    # each distinct pair goes through gettext once for the whole batch.
+    ngettext = lru_cache(maxsize=None)(get_translation().ngettext)
     decimal_sep = decimal_separator()
-    number = (format % rounded_value).replace(".", decimal_sep)
-    return f"{negative_prefix}{number} {unit}"
+    items, shape = _unpack_values(values)
+
+    results: list[Any] = []
+    scaled: list[int] = []  # Positions in `results` of the values to scale
+    for value in map(_int_or_text, items):
+        if isinstance(value, str):
+            results.append(value)
+        elif -powers[0] < value < powers[0]:
+            results.append(str(value))
+        else:
+            scaled.append(len(results))
+            results.append(value)
+
+    magnitudes = [abs(results[i]) for i in scaled]
+    ordinals = _powers_insertion_points(magnitudes)
+    for i, value, ordinal in zip(scaled, magnitudes, ordinals):
+        negative_prefix = "-" if results[i] < 0 else ""
+        results[i] = negative_prefix + _scale_intword(
+            value, ordinal, format, ngettext, decimal_sep
+        )
+    return _pack_results(results, shape)
+
+
+def _powers_insertion_points(magnitudes: list[int]) -> list[int]:
+    """Return `bisect.bisect_right(powers, m)` for every `m` in `magnitudes`."""
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and magnitudes:
+        try:
+            array = numpy.array(magnitudes, dtype=numpy.uint64)
+        except OverflowError:
+            pass
+        else:
+            # Every power up to 10**18 fits in an uint64, and any uint64 is smaller
+            # than the following powers, so the shortened table gives the same result.
+            table = numpy.array([p for p in powers if p < 2**64], dtype=numpy.uint64)
+            return numpy.searchsorted(table, array, side="right").tolist()
+    return [bisect.bisect_right(powers, m) for m in magnitudes]
+
+
+def intword_column(
+    values: Iterable[NumberOrString],
+    format: str = "%.1f",
+    reference: NumberOrString | None = None,
+) -> Any:
+    """Converts a column of integers to friendly text sharing a single unit.
+
+    Unlike `intword`, which picks a unit for every value, the unit is chosen once for
+    the whole column: the one `intword` would use for `reference`, by default the
+    largest absolute value of the column. Every value is then formatted with a plain
+    division, so the cells of a table line up.
+
+    Examples:
+        ```pycon
+        >>> intword_column([900_000, 1_200_000, -35_000_000, None])
+        ['0.9 million', '1.2 million', '-35.0 million', 'None']
+        >>> intword_column([900_000, 1_200_000], reference=1000)
+        ['900.0 thousand', '1200.0 thousand']
+        >>> intword_column([12, 999])
+        ['12', '999']
+        >>> intword_column([10**400, 5])[0] == f"{10**300}.0 googol"
+        True
+        >>> intword_column([1000, float("nan")])
+        ['1.0 thousand', 'NaN']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Integers to convert. NumPy arrays are
+            accepted.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+        reference (int, float, str, None): Value whose unit is used for the column.
+            Defaults to the largest absolute value in `values`, which is also used
+            if `reference` is not finite.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+    """
+    items, shape = _unpack_values(values)
+    numbers = [_int_or_text(value) for value in items]
+    if reference is not None:
+        reference = _int_or_text(reference)
+        if reference in ("NaN", "+Inf", "-Inf"):
+            reference = None
+        else:
+            reference = abs(int(reference))
+    if reference is None:
+        reference = max((abs(n) for n in numbers if not isinstance(n, str)), default=0)
+
+    if reference < powers[0]:
+        return _pack_results([str(n) for n in numbers], shape)
+
+    ordinal = bisect.bisect_right(powers, reference) - 1
+    power = powers[ordinal]
+    if ordinal + 1 < len(powers):
+        rounded = Decimal(_divide_intword(reference, power, format))
+        if rounded == powers[ordinal + 1] // power:
+            # After rounding, the reference ends up just at the next power
+            ordinal += 1
+            power = powers[ordinal]
+
+    singular, plural = human_powers[ordinal]
+    ngettext = lru_cache(maxsize=None)(get_translation().ngettext)
+    decimal_sep = decimal_separator()
+    results: list[str] = []
+    for n in numbers:
+        if isinstance(n, str):
+            results.append(n)
+            continue
+        number = _divide_intword(abs(n), power, format)
+        unit = ngettext(singular, plural, math.ceil(Decimal(number)))
+        negative_prefix = "-" if n < 0 else ""
+        results.append(f"{negative_prefix}{number.replace('.', decimal_sep)} {unit}")
+    return _pack_results(results, shape)
+
+
+def parse_intword(text: str, locale: str | None = None) -> int | Decimal:
+    """Parse the friendly text representation of an integer, e.g. "1.2 billion".
+
+    This is the inverse of `intword`. The unit words are those of the `human_powers`
+    catalog in the given locale, matched case-insensitively, and the decimal separator
+    is the one of that locale. Text without a unit word is read as a plain number.
+
+    Examples:
+        ```pycon
+        >>> parse_intword("1.2 billion")
+        1200000000
+        >>> parse_intword("-3.4 Million")
+        -3400000
+        >>> parse_intword("1.2345 thousand")
+        Decimal('1234.5')
+        >>> parse_intword("100")
+        100
+        >>> parse_intword("a lot")
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot parse 'a lot' as a number with a unit
+
+        ```
+
+    Args:
+        text (str): Text to parse.
+        locale (str, None): Locale of the text. If `None`, the active locale is used.
+
+    Returns:
+        int or Decimal: The exact value, as an int when it is a whole number.
+
+    Raises:
+        ValueError: If `text` is not a number optionally followed by a unit word.
+    """
+    return _intword_parser(_current_locale() if locale is None else locale)(text)
+
+
+def parse_intword_many(
+    texts: Iterable[str], locale: str | None = None
+) -> list[int | Decimal]:
+    """Parse many friendly text representations of integers.
+
+    This is the batch version of `parse_intword`, e.g. for a column of a report.
+
+    Examples:
+        ```pycon
+        >>> parse_intword_many(["1.2 billion", "3.4 million", "999"])
+        [1200000000, 3400000, 999]
+
+        ```
+
+    Args:
+        texts (iterable of str): Texts to parse.
+        locale (str, None): Locale of the texts. If `None`, the active locale is used.
+
+    Returns:
+        list of int or Decimal: The exact values, in the same order.
+
+    Raises:
+        ValueError: If a text is not a number optionally followed by a unit word.
+    """
+    parse = _intword_parser(_current_locale() if locale is None else locale)
+    return [parse(text) for text in texts]
+
+
+@lru_cache(maxsize=None)
+def _intword_parser(locale: str | None) -> Callable[[str], int | Decimal]:
+    """Build the parser of `intword` output for `locale`, once per locale."""
+    import re
+
+    with _use_locale(locale):
+        translation = get_translation()
+        decimal_sep = decimal_separator()
+
+    # Collect every plural form of every unit word. The counts cover the plural
+    # rules of all the catalogs, which only depend on the last two digits.
+    exponents: dict[str, int] = {}
+    for (singular, plural), power in zip(human_powers, powers):
+        for count in range(100):
+            word = translation.ngettext(singular, plural, count)
+            exponents.setdefault(word.casefold(), _exponent(power))
+
+    words = "|".join(map(re.escape, sorted(exponents, key=len, reverse=True)))
+    number = rf"[-+]?\d+(?:{re.escape(decimal_sep)}\d+)?"
+    pattern = re.compile(rf"\s*({number})(?:\s*({words}))?\s*", re.IGNORECASE)
+
+    def parse(text: str) -> int | Decimal:
+        match = pattern.fullmatch(text)
+        if match is None:
+            msg = f"Cannot parse {text!r} as a number with a unit"
+            raise ValueError(msg)
+        number, word = match.groups()
+        sign, digits, exponent = Decimal(number.replace(decimal_sep, ".")).as_tuple()
+        assert isinstance(exponent, int)  # The pattern only matches finite numbers
+        if word:
+            exponent += exponents[word.casefold()]
+        # Build the result from the digits directly, so no context rounding applies
+        value = Decimal((sign, digits, exponent))
+        if exponent >= 0 or not any(digits[exponent:]):
+            return int(value)
+        return value
+
+    return parse
 
 
 def apnumber(value: NumberOrString) -> str:
@@ -294,16 +934,11 @@ def apnumber(value: NumberOrString) -> str:
             returns a string unless the value was not `int`-able, then `str(value)`
             is returned.
     """
-    import math
+    return _apnumber(value, _apnumber_words())
 
-    try:
-        if not math.isfinite(float(value)):
-            return _format_not_finite(float(value))
-        value = int(value)
-    except (TypeError, ValueError):
-        return str(value)
-    if not 0 <= value < 10:
-        return str(value)
+
+def _apnumber_words() -> tuple[str, ...]:
+    """Return the translated words for the numbers 0-9."""
     return (
         _("zero"),
         _("one"),
@@ -315,10 +950,20 @@ def apnumber(value: NumberOrString) -> str:
         _("seven"),
         _("eight"),
         _("nine"),
-    )[value]
+    )
 
 
-def fractional(value: NumberOrString) -> str:
+def _apnumber(value: NumberOrString, words: tuple[str, ...]) -> str:
+    """Implementation of `apnumber` with the words already translated."""
+    value = _int_or_text(value)
+    if isinstance(value, str):
+        return value
+    if not 0 <= value < 10:
+        return str(value)
+    return words[value]
+
+
+def fractional(value: NumberOrString, max_denominator: int = 1000) -> str:
     """Convert to fractional number.
 
     There will be some cases where one might not want to show ugly decimal places for
@@ -342,6 +987,8 @@ def fractional(value: NumberOrString) -> str:
         '1 3/10'
         >>> fractional(float(1/3))
         '1/3'
+        >>> fractional(3.14159, max_denominator=10)
+        '3 1/7'
         >>> fractional(1)
         '1'
         >>> fractional("ten")
@@ -353,24 +1000,34 @@ def fractional(value: NumberOrString) -> str:
 
     Args:
         value (int, float, str): Integer to convert.
+        max_denominator (int): Largest denominator of the fractional part.
 
     Returns:
         str: Fractional number as a string.
+
+    Raises:
+        ValueError: If `max_denominator` is smaller than 1.
     """
-    import math
+    if max_denominator < 1:
+        msg = "max_denominator should be at least 1"
+        raise ValueError(msg)
+    number = _float_or_text(value)
+    if isinstance(number, str):
+        return number
+    return _fractional(number, max_denominator)
 
-    try:
-        number = float(value)
-        if not math.isfinite(number):
-            return _format_not_finite(number)
-    except (TypeError, ValueError):
-        return str(value)
-    from fractions import Fraction
 
+@lru_cache(maxsize=1024)
+def _fractional(number: float, max_denominator: int) -> str:
+    """Implementation of `fractional` for a finite float.
+
+    Real-world inputs tend to repeat a small set of values, so the results are kept
+    in a bounded cache.
+    """
     whole_number = int(number)
-    frac = Fraction(number - whole_number).limit_denominator(1000)
-    numerator = frac.numerator
-    denominator = frac.denominator
+    numerator, denominator = _limit_denominator(
+        *(number - whole_number).as_integer_ratio(), max_denominator
+    )
     if whole_number and not numerator and denominator == 1:
         # this means that an integer was passed in
         # (or variants of that integer like 1.0000)
@@ -382,6 +1039,78 @@ def fractional(value: NumberOrString) -> str:
     return f"{whole_number:.0f} {numerator:.0f}/{denominator:.0f}"
 
 
+def _limit_denominator(
+    numerator: int, denominator: int, max_denominator: int
+) -> tuple[int, int]:
+    """Return the closest fraction to `numerator / denominator` as a pair of ints.
+
+    This is the continued fraction algorithm of `Fraction.limit_denominator`, working
+    directly on ints: the closest of the two best approximations with a denominator of
+    at most `max_denominator` is chosen by cross-multiplication, without creating any
+    `Fraction`. The input must be in lowest terms, with a positive denominator, as
+    given by `float.as_integer_ratio()`.
+
+    >>> _limit_denominator(*(3.141592653589793).as_integer_ratio(), 100)
+    (311, 99)
+    >>> _limit_denominator(1, 4, 1000)
+    (1, 4)
+    """
+    if denominator <= max_denominator:
+        return numerator, denominator
+
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+
+    k = (max_denominator - q0) // q1
+    p0, q0 = p0 + k * p1, q0 + k * q1
+    # Compare |p1/q1 - x| with |p0/q0 - x|, where x = numerator / denominator, both
+    # scaled by denominator * q0 * q1. Ties go to p1/q1, the smaller denominator.
+    error1 = abs(p1 * denominator - numerator * q1) * q0
+    error0 = abs(p0 * denominator - numerator * q0) * q1
+    if error1 <= error0:
+        return p1, q1
+    return p0, q0
+
+
+def fractional_many(
+    values: Iterable[NumberOrString], max_denominator: int = 1000
+) -> Any:
+    """Convert many numbers to fractional numbers.
+
+    This is the batch version of `fractional`.
+
+    Examples:
+        ```pycon
+        >>> fractional_many([0.25, 1.5, 0.3, 2, "ten"])
+        ['1/4', '1 1/2', '3/10', '2', 'ten']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Numbers to convert. NumPy arrays are
+            accepted.
+        max_denominator (int): Largest denominator of the fractional part.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+
+    Raises:
+        ValueError: If `max_denominator` is smaller than 1.
+    """
+    items, shape = _unpack_values(values)
+    return _pack_results(
+        [fractional(value, max_denominator) for value in items], shape
+    )
+
+
 def scientific(value: NumberOrString, precision: int = 2) -> str:
     """Return number in string scientific notation z.wq x 10ⁿ.
 
@@ -399,6 +1128,10 @@ def scientific(value: NumberOrString, precision: int = 2) -> str:
         '1.000 x 10³'
         >>> scientific("99")
         '9.90 x 10¹'
+        >>> scientific(10**400)
+        '1.00 x 10⁴⁰⁰'
+        >>> scientific("9" * 400 + ".5")
+        '1.00 x 10⁴⁰⁰'
         >>> scientific("foo")
         'foo'
         >>> scientific(None)
@@ -413,42 +1146,76 @@ def scientific(value: NumberOrString, precision: int = 2) -> str:
     Returns:
         str: Number in scientific notation z.wq x 10ⁿ.
     """
-    import math
-
-    exponents = {
-        "0": "⁰",
-        "1": "¹",
-        "2": "²",
-        "3": "³",
-        "4": "⁴",
-        "5": "⁵",
-        "6": "⁶",
-        "7": "⁷",
-        "8": "⁸",
-        "9": "⁹",
-        "-": "⁻",
-    }
+    return _scientific(value, f".{int(precision)}e")
+
+
+# Translation table from the characters of an exponent to their superscripts
+_SUPERSCRIPTS = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
+
+
+def _scientific(value: NumberOrString, spec: str) -> str:
+    """Implementation of `scientific` with the format spec already built."""
+    parsed: float | Decimal
+    number: Decimal
     try:
-        value = float(value)
-        if not math.isfinite(value):
-            return _format_not_finite(value)
+        if isinstance(value, str):
+            # A zero stays a float, which keeps the sign of "-0"
+            parsed = _parse_number(value) or float(value)
+        else:
+            parsed = value
+        if isinstance(parsed, int) and parsed:
+            number = Decimal(parsed)
+        elif isinstance(parsed, Decimal) and parsed and parsed.is_finite():
+            number = parsed
+        else:
+            parsed = float(parsed)
+            if not math.isfinite(parsed):
+                return _format_not_finite(parsed)
+            part1, part2 = format(parsed, spec).split("e")
+            # Going through int() drops the redundant '+' and leading '0's.
+            return part1 + " x 10" + str(int(part2)).translate(_SUPERSCRIPTS)
     except (ValueError, TypeError):
         return str(value)
-    fmt = f"{{:.{str(int(precision))}e}}"
-    n = fmt.format(value)
-    part1, part2 = n.split("e")
-    # Remove redundant leading '+' or '0's (preserving the last '0' for 10⁰).
-    import re
 
-    part2 = re.sub(r"^\+?(\-?)0*(.+)$", r"\1\2", part2)
+    # ints and Decimals: shift their exact digits by the exponent of the leading
+    # digit, so nothing is rounded except the mantissa, at any size.
+    spec = spec[:-1] + "f"
+    exponent = _exponent(number)
+    sign, digits, exp = number.as_tuple()
+    assert isinstance(exp, int)  # Only NaNs and infinities have a str exponent
+    mantissa = format(Decimal((sign, digits, exp - exponent)), spec)
+    if mantissa.lstrip("-").startswith("10"):
+        # Rounding carried over to the next power of ten, e.g. 9.999 -> 10.00
+        exponent += 1
+        mantissa = format(Decimal((sign, digits, exp - exponent)), spec)
+    return mantissa + " x 10" + str(exponent).translate(_SUPERSCRIPTS)
 
-    new_part2 = []
-    for char in part2:
-        new_part2.append(exponents[char])
 
-    final_str = part1 + " x 10" + "".join(new_part2)
+def scientific_many(values: Iterable[NumberOrString], precision: int = 2) -> Any:
+    """Return many numbers in string scientific notation z.wq x 10ⁿ.
 
-    return final_str
+    This is the batch version of `scientific`.
+
+    Examples:
+        ```pycon
+        >>> scientific_many([0.3, 500, "-1000", "foo"])
+        ['3.00 x 10⁻¹', '5.00 x 10²', '-1.00 x 10³', 'foo']
+        >>> scientific_many(range(0, 30, 10), 1)
+        ['0.0 x 10⁰', '1.0 x 10¹', '2.0 x 10¹']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Input numbers. NumPy arrays are accepted.
+        precision (int): Number of decimal for first part of the number.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+    """
+    spec = f".{int(precision)}e"
+    items, shape = _unpack_values(values)
+    return _pack_results([_scientific(value, spec) for value in items], shape)
 
 
 def clamp(
@@ -498,8 +1265,6 @@ def clamp(
             will be prepended with a token indicating as such.
 
     """
-    import math
-
     if value is None:
         return None
 
@@ -541,6 +1306,8 @@ def metric(value: float, unit: str = "", precision: int = 3) -> str:
         '220 μF'
         >>> metric(1e-14, precision=4)
         '10.00 f'
+        >>> metric(999_999_999_999_999)
+        '1.00 P'
 
         ```
 
@@ -563,26 +1330,299 @@ def metric(value: float, unit: str = "", precision: int = 3) -> str:
     Returns:
         str:
     """
-    import math
-
     if not math.isfinite(value):
         return _format_not_finite(value)
-    exponent = int(math.floor(math.log10(abs(value)))) if value != 0 else 0
+    exponent = _exponent(value) if value != 0 else 0
+    return _format_metric(value, exponent, unit, precision, {})
 
-    if exponent >= 33 or exponent < -30:
-        return scientific(value, precision - 1) + unit
 
-    value /= 10 ** (exponent // 3 * 3)
+def _format_metric(
+    value: float,
+    exponent: int,
+    unit: str,
+    precision: int,
+    buckets: dict[int, tuple[float, str, str]],
+) -> str:
+    """Format a finite `value` whose leading digit has `exponent`, as `metric` does.
+
+    `buckets` caches the results of `_metric_bucket` by exponent.
+    """
+    while True:
+        if exponent >= 33 or exponent < -30:
+            return scientific(value, precision - 1) + unit
+        try:
+            divisor, spec, suffix = buckets[exponent]
+        except KeyError:
+            divisor, spec, suffix = buckets[exponent] = _metric_bucket(
+                exponent, unit, precision
+            )
+        text = format(value / divisor, spec)
+        if not _metric_rounds_up(text, exponent):
+            return text + suffix
+        # Rounding carried over to the next power of ten, as in 999.9 k -> 1000 k,
+        # so use the exponent of the rounded value
+        exponent += 1
+
+
+def _metric_rounds_up(text: str, exponent: int) -> bool:
+    """Return whether the number `text` has more integer digits than `exponent` gives.
+
+    >>> _metric_rounds_up("999", 2), _metric_rounds_up("1000", 2)
+    (False, True)
+    """
+    return len(text.lstrip("-").partition(".")[0]) > exponent % 3 + 1
+
+
+def _metric_bucket(exponent: int, unit: str, precision: int) -> tuple[float, str, str]:
+    """Return the divisor, format spec and suffix used by `metric` for `exponent`."""
     if exponent >= 3:
         ordinal_ = "kMGTPEZYRQ"[exponent // 3 - 1]
     elif exponent < 0:
         ordinal_ = "mμnpfazyrq"[(-exponent - 1) // 3]
     else:
         ordinal_ = ""
-    value_ = format(value, f".{int(max(0, precision - exponent % 3 - 1))}f")
     if not (unit or ordinal_) or unit in ("°", "′", "″"):
         space = ""
     else:
         space = " "
 
-    return f"{value_}{space}{ordinal_}{unit}"
+    divisor = 10 ** (exponent // 3 * 3)
+    spec = f".{int(max(0, precision - exponent % 3 - 1))}f"
+    return divisor, spec, f"{space}{ordinal_}{unit}"
+
+
+def metric_many(values: Iterable[float], unit: str = "", precision: int = 3) -> Any:
+    """Return many values with a metric SI unit-prefix appended.
+
+    This is the batch version of `metric`. The exponents of all values are computed
+    in one pass, and the prefix, divisor and format spec are derived only once per
+    distinct exponent. Values too huge or too tiny for a prefix fall back to
+    `scientific()`, as with `metric`.
+
+    Examples:
+        ```pycon
+        >>> metric_many([1500, 2e8, 220e-6, 0], "V")
+        ['1.50 kV', '200 MV', '220 μV', '0.00 V']
+        >>> metric_many([1e40, float("inf")])
+        ['1.00 x 10⁴⁰', '+Inf']
+
+        ```
+
+    Args:
+        values (iterable of int, float): Input numbers. NumPy arrays are accepted.
+        unit (str): Optional base unit.
+        precision (int): The number of digits the output should contain.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+    """
+    items, shape = _unpack_values(values)
+    buckets: dict[int, tuple[float, str, str]] = {}
+    results: list[str] = []
+    for value in items:
+        if value == 0:
+            exponent = 0
+        elif math.isfinite(value):
+            exponent = _exponent(value)
+        else:
+            results.append(_format_not_finite(value))
+            continue
+
+        results.append(_format_metric(value, exponent, unit, precision, buckets))
+    return _pack_results(results, shape)
+
+
+def metric_column(
+    values: Iterable[float],
+    unit: str = "",
+    precision: int = 3,
+    reference: float | None = None,
+) -> Any:
+    """Return a column of values sharing a single metric SI unit-prefix.
+
+    Unlike `metric`, which picks a prefix for every value, the prefix and the number
+    of decimals are chosen once for the whole column: those `metric` would use for
+    `reference`, by default the largest absolute value of the column. Every value is
+    then formatted with a plain division, so the cells of a table line up.
+
+    Examples:
+        ```pycon
+        >>> metric_column([1500, 220, 12_000], "V")
+        ['1.5 kV', '0.2 kV', '12.0 kV']
+        >>> metric_column([1500, 220], "V", reference=1)
+        ['1500.00 V', '220.00 V']
+
+        ```
+
+    Args:
+        values (iterable of int, float): Input numbers. NumPy arrays are accepted.
+        unit (str): Optional base unit.
+        precision (int): The number of digits the output should contain for the
+            reference value.
+        reference (int, float, None): Value whose prefix is used for the column.
+            Defaults to the largest absolute finite value in `values`, which is also
+            used if `reference` is not finite.
+
+    Returns:
+        list of str or numpy.ndarray: The converted values, in the same order. A NumPy
+            array input gives an object array of the same shape.
+    """
+    items, shape = _unpack_values(values)
+    items = list(items)
+    if reference is None or not math.isfinite(reference):
+        reference = max((abs(v) for v in items if math.isfinite(v)), default=0)
+    exponent = _exponent(reference) if reference else 0
+    if exponent < 33 and exponent >= -30:
+        divisor, spec, _ = _metric_bucket(exponent, unit, precision)
+        if _metric_rounds_up(format(reference / divisor, spec), exponent):
+            exponent += 1
+
+    if exponent >= 33 or exponent < -30:
+        return _pack_results([metric(value, unit, precision) for value in items], shape)
+
+    divisor, spec, suffix = _metric_bucket(exponent, unit, precision)
+    results = [
+        format(value / divisor, spec) + suffix
+        if math.isfinite(value)
+        else _format_not_finite(value)
+        for value in items
+    ]
+    return _pack_results(results, shape)
+
+
+class NumberFormatter:
+    """A number humanizing function bound to its options and a locale.
+
+    Calling one of the functions of this module repeatedly with the same options
+    re-derives the same state every time: translated words, locale separators and so
+    on. A `NumberFormatter` resolves all of that once, when it is created, and can
+    then be called like the function it wraps.
+
+    Supported functions are `intcomma`, `intword`, `ordinal`, `apnumber`, `scientific`
+    and `metric`. Formatters can be pickled, for example to send them to worker
+    processes. The bound state is derived again when they are unpickled.
+
+    Examples:
+        ```pycon
+        >>> fmt = NumberFormatter(intword, format="%.2f")
+        >>> fmt(1_234_000)
+        '1.23 million'
+        >>> fmt.map([12_400, "1000000", None])
+        ['12.40 thousand', '1.00 million', 'None']
+        >>> NumberFormatter(ordinal, gender="female")(3)
+        '3rd'
+        >>> import pickle
+        >>> pickle.loads(pickle.dumps(fmt))(5_000_000_000)
+        '5.00 billion'
+
+        ```
+
+    Args:
+        function (callable): The function to bind, e.g. `intcomma`.
+        locale (str, None): Locale to format with. If `None`, the locale active when
+            the formatter is created is used.
+        **options: Keyword arguments of `function`, except the value itself.
+
+    Raises:
+        ValueError: If `function` is not supported.
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., str],
+        locale: str | None = None,
+        **options: Any,
+    ) -> None:
+        if function not in _FORMATTER_BINDERS:
+            msg = f"NumberFormatter does not support {function!r}"
+            raise ValueError(msg)
+        self.function = function
+        self.locale = _current_locale() if locale is None else locale
+        self.options = options
+        self._bind()
+
+    def _bind(self) -> None:
+        with _use_locale(self.locale):
+            self._format = _FORMATTER_BINDERS[self.function](**self.options)
+
+    def __call__(self, value: Any) -> str:
+        """Format a single value."""
+        return self._format(value)
+
+    def map(self, values: Iterable[Any]) -> Any:
+        """Format every value of an iterable.
+
+        Args:
+            values (iterable): Values to format. NumPy arrays are accepted.
+
+        Returns:
+            list of str or numpy.ndarray: The formatted values, in the same order. A
+                NumPy array input gives an object array of the same shape.
+        """
+        items, shape = _unpack_values(values)
+        return _pack_results(list(map(self._format, items)), shape)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "function": self.function,
+            "locale": self.locale,
+            "options": self.options,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.function = state["function"]
+        self.locale = state["locale"]
+        self.options = state["options"]
+        self._bind()
+
+    def __repr__(self) -> str:
+        options = "".join(f", {key}={value!r}" for key, value in self.options.items())
+        return (
+            f"{type(self).__name__}({self.function.__name__}"
+            f"{options}, locale={self.locale!r})"
+        )
+
+
+def _bind_intcomma(ndigits: int | None = None) -> Callable[[Any], str]:
+    return partial(
+        _intcomma,
+        ndigits=ndigits,
+        thousands_sep=thousands_separator(),
+        decimal_sep=decimal_separator(),
+    )
+
+
+def _bind_intword(format: str = "%.1f") -> Callable[[Any], str]:
+    return partial(
+        _intword,
+        format=format,
+        ngettext=lru_cache(maxsize=None)(get_translation().ngettext),
+        decimal_sep=decimal_separator(),
+    )
+
+
+def _bind_ordinal(gender: str = "male") -> Callable[[Any], str]:
+    return partial(_ordinal, suffixes=_ordinal_suffixes(gender))
+
+
+def _bind_apnumber() -> Callable[[Any], str]:
+    return partial(_apnumber, words=_apnumber_words())
+
+
+def _bind_scientific(precision: int = 2) -> Callable[[Any], str]:
+    return partial(_scientific, spec=f".{int(precision)}e")
+
+
+def _bind_metric(unit: str = "", precision: int = 3) -> Callable[[Any], str]:
+    return partial(metric, unit=unit, precision=precision)
+
+
+_FORMATTER_BINDERS: dict[Callable[..., str], Callable[..., Callable[[Any], str]]] = {
+    intcomma: _bind_intcomma,
+    intword: _bind_intword,
+    ordinal: _bind_ordinal,
+    apnumber: _bind_apnumber,
+    scientific: _bind_scientific,
+    metric: _bind_metric,
+}
@@ -5,25 +5,48 @@ These are largely borrowed from Django's `contrib.humanize`.
 
 from __future__ import annotations
 
+import math
+import sys
+import threading
+import time as _time
+from bisect import bisect_right
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
+from typing import NamedTuple
 
 from .i18n import _gettext as _
-from .i18n import _ngettext
-from .number import intcomma
+from .i18n import _gettext_noop as N_
+from .i18n import _ngettext_noop as NS_
+from .i18n import get_translation
+from .number import _pack_results, _unpack_values, intcomma
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     import datetime as dt
-    from collections.abc import Iterable
-    from typing import Any
+    import gettext
+    from collections.abc import Iterable, Iterator
+    from typing import Any, Dict, List, Optional, Tuple, Union
+
+    # A message id or a pair of singular and plural message ids, and its count
+    _Message = Tuple[Union[str, Tuple[str, str]], int]
+    # The boundaries and messages of `naturaldelta`, the outputs rendered so far, and
+    # the outputs kept by the render cache, by key and tense
+    _Table = Tuple[
+        List[int], List[_Message], List[Optional[str]], Dict[Tuple[int, Optional[bool]], str]
+    ]
 
 __all__ = [
+    "PrecisedeltaPlan",
     "naturaldate",
+    "naturaldate_many",
     "naturalday",
     "naturaldelta",
+    "naturaldelta_many",
     "naturaltime",
+    "naturaltime_many",
     "precisedelta",
+    "render_cache_info",
+    "set_render_cache",
 ]
 
 
@@ -136,11 +159,8 @@ def naturaldelta(
     """
     import datetime as dt
 
-    tmp = Unit[minimum_unit.upper()]
-    if tmp not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
-        msg = f"Minimum unit '{minimum_unit}' not supported"
-        raise ValueError(msg)
-    min_unit = tmp
+    translation = get_translation()
+    table = _naturaldelta_texts(translation, bool(months), minimum_unit)
 
     if isinstance(value, dt.timedelta):
         delta = value
@@ -152,98 +172,467 @@ def naturaldelta(
         except (ValueError, TypeError):
             return str(value)
 
-    use_months = months
-
     delta = abs(delta)
-    years = delta.days // 365
-    days = delta.days % 365
-    num_months = round(days / 30.5)
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    key = _naturaldelta_key(micros, table[0])
+    if _RENDER_CACHE_SIZE is None:
+        return _render_naturaldelta(key, translation, table)
+    return _cached_render(key, None, translation, table)
+
+
+def naturaldelta_many(
+    values: Iterable[Any],
+    months: bool = True,
+    minimum_unit: str = "seconds",
+) -> Any:
+    """Return natural representations of many timedeltas or numbers of seconds.
+
+    This is the batch version of `naturaldelta`. NumPy `timedelta64` and numeric
+    arrays are converted and looked up in the boundary table all at once, and every
+    distinct output is rendered only once.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> naturaldelta_many([dt.timedelta(minutes=30), 1, 3600 * 30, "x"])
+        ['30 minutes', 'a second', 'a day', 'x']
+
+        ```
+
+    Args:
+        values (iterable): Timedeltas or numbers of seconds. NumPy arrays of
+            `timedelta64` or of numbers are accepted.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+
+    Returns:
+        list of str or numpy.ndarray: The natural representations, in the same order.
+            Values that are not timedeltas or numbers are returned as strings. A NumPy
+            array input gives an object array of the same shape.
+
+    Raises:
+        OverflowError: If a value is too large to convert to datetime.timedelta.
+    """
+    translation = get_translation()
+    table = _naturaldelta_texts(translation, bool(months), minimum_unit)
+    items, micros, _, shape = _micros_many(values, None, False, False)
+    keys = _naturaldelta_keys(micros, table[0])
+
+    rendered: dict[int, str] = {}
+    results = []
+    for index, key in enumerate(keys):
+        if key is None:
+            results.append(str(items[index]))
+            continue
+        text = rendered.get(key)
+        if text is None:
+            text = rendered[key] = _render_naturaldelta(key, translation, table)
+        results.append(text)
+    return _pack_results(results, shape)
+
+
+_SECOND = 1_000_000
+_DAY = 86_400 * _SECOND
+_YEAR = 365 * _DAY
+
+# The tables of `naturaldelta` by translation, `months` and minimum unit, with the
+# outputs in that translation, rendered on first use, and those of the render cache
+_NATURALDELTA_TEXTS: dict[tuple[gettext.NullTranslations, bool, str], _Table] = {}
+
+
+def _naturaldelta_texts(
+    translation: gettext.NullTranslations, months: bool, minimum_unit: str
+) -> _Table:
+    """Return the table of `naturaldelta` and the outputs rendered or cached so far.
+
+    Raises:
+        ValueError: If `minimum_unit` is not supported.
+    """
+    key = (translation, months, minimum_unit)
+    try:
+        return _NATURALDELTA_TEXTS[key]
+    except KeyError:
+        pass
+
+    min_unit = Unit[minimum_unit.upper()]
+    if min_unit not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
+        msg = f"Minimum unit '{minimum_unit}' not supported"
+        raise ValueError(msg)
+    boundaries, messages = _naturaldelta_table(months, min_unit)
+    table: _Table = (boundaries, messages, [None] * len(messages), {})
+    _NATURALDELTA_TEXTS[key] = table
+    return table
+
+
+def _naturaldelta_key(micros: int, boundaries: list[int]) -> int:
+    """Identify the output of `naturaldelta` for a non-negative number of microseconds.
+
+    This is the index of the entry of the table for deltas shorter than two years,
+    and the number of years past the end of the table for longer ones.
+    """
+    if micros < 2 * _YEAR:
+        return bisect_right(boundaries, micros) - 1
+    return len(boundaries) + micros // _YEAR
 
-    if years == 0 and days < 1:
-        if delta.seconds == 0:
-            if min_unit == Unit.MICROSECONDS and delta.microseconds < 1000:
-                return (
-                    _ngettext("%d microsecond", "%d microseconds", delta.microseconds)
-                    % delta.microseconds
-                )
 
-            if min_unit == Unit.MILLISECONDS or (
-                min_unit == Unit.MICROSECONDS and 1000 <= delta.microseconds < 1_000_000
-            ):
-                milliseconds = delta.microseconds / 1000
-                return (
-                    _ngettext("%d millisecond", "%d milliseconds", int(milliseconds))
-                    % milliseconds
-                )
-            return _("a moment")
+def _naturaldelta_keys(micros: Any, boundaries: list[int]) -> list[int | None]:
+    """Apply `_naturaldelta_key` to the absolute values of `micros`, keeping `None`s.
 
-        if delta.seconds == 1:
-            return _("a second")
+    `micros` is either a list, or a NumPy masked array of int64, in which case the
+    keys are computed for the whole array at once.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None or not isinstance(micros, numpy.ndarray):
+        return [
+            None if value is None else _naturaldelta_key(abs(value), boundaries)
+            for value in micros
+        ]
+
+    magnitudes = numpy.abs(micros.filled(0))
+    keys = numpy.where(
+        magnitudes < 2 * _YEAR,
+        numpy.searchsorted(numpy.array(boundaries), magnitudes, side="right") - 1,
+        len(boundaries) + magnitudes // _YEAR,
+    )
+    return numpy.ma.array(keys, mask=numpy.ma.getmaskarray(micros)).tolist()
 
-        if delta.seconds < 60:
-            return _ngettext("%d second", "%d seconds", delta.seconds) % delta.seconds
 
-        if 60 <= delta.seconds < 3600:
-            minutes = round(delta.seconds / 60)
-            if minutes == 1:
-                return _("a minute")
+def _render_naturaldelta(
+    key: int,
+    translation: gettext.NullTranslations,
+    table: _Table,
+) -> str:
+    """Render the output of `naturaldelta` identified by `key` in `translation`."""
+    messages, texts = table[1], table[2]
+    if key >= len(messages):
+        years = key - len(messages)
+        return translation.ngettext("%d year", "%d years", years).replace(
+            "%d", "%s"
+        ) % intcomma(years)
+
+    text = texts[key]
+    if text is None:
+        message, count = messages[key]
+        if isinstance(message, tuple):
+            text = translation.ngettext(*message, count) % count
+        else:
+            text = translation.gettext(message)
+        texts[key] = text
+    return text
+
+
+def _render_naturaltime(
+    key: int,
+    future: bool,
+    translation: gettext.NullTranslations,
+    table: _Table,
+) -> str:
+    """Render the output of `naturaltime` identified by `key` and its tense."""
+    delta = _render_naturaldelta(key, translation, table)
+    if delta == translation.gettext("a moment"):
+        return translation.gettext("now")
+    if future:
+        return translation.gettext("%s from now") % delta
+    return translation.gettext("%s ago") % delta
 
-            if minutes == 60:
-                return _("an hour")
 
-            return _ngettext("%d minute", "%d minutes", minutes) % minutes
+class RenderCacheInfo(NamedTuple):
+    """Statistics of the render cache, as returned by `render_cache_info`."""
 
-        if 3600 <= delta.seconds:
-            hours = round(delta.seconds / 3600)
-            if hours == 1:
-                return _("an hour")
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
-            if hours == 24:
-                return _("a day")
 
-            return _ngettext("%d hour", "%d hours", hours) % hours
+# The largest number of outputs the render cache keeps per table of
+# `_NATURALDELTA_TEXTS`, or `None` if it is disabled, and its hits and misses.
+# The lock guards these and the cached outputs of every table.
+_RENDER_CACHE_SIZE: int | None = None
+_RENDER_CACHE_COUNTS = [0, 0]
+_RENDER_CACHE_LOCK = threading.Lock()
 
-    elif years == 0:
-        if days == 1:
-            return _("a day")
 
-        if not use_months:
-            return _ngettext("%d day", "%d days", days) % days
+def set_render_cache(maxsize: int | None = 1024) -> None:
+    """Enable, resize or disable the render cache of `naturaldelta` and `naturaltime`.
 
-        if num_months == 0:
-            return _ngettext("%d day", "%d days", days) % days
+    The cache is opt-in. Once enabled, the outputs of `naturaldelta` and `naturaltime`
+    are kept by locale, `months`, minimum unit, tense and rounded value, such as
+    "3 minutes", so every delta rounding to the same output gets the same string
+    without rendering or translating it again. This saves the work of `naturaltime`
+    on its tense, and of `naturaldelta` on deltas of more than two years: shorter
+    deltas are rendered once per locale anyway. The cache is shared by all threads.
+    Calling this again empties it and resets its counters.
 
-        if num_months == 1:
-            return _("a month")
+    Examples:
+        ```pycon
+        >>> set_render_cache(16)
+        >>> naturaltime(180), naturaltime(185), naturaltime(3600)
+        ('3 minutes ago', '3 minutes ago', 'an hour ago')
+        >>> render_cache_info()
+        RenderCacheInfo(hits=1, misses=2, maxsize=16, currsize=2)
+        >>> set_render_cache(None)
+        >>> render_cache_info() is None
+        True
 
-        if num_months == 12:
-            return _("a year")
+        ```
 
-        return _ngettext("%d month", "%d months", num_months) % num_months
+    Args:
+        maxsize (int, None): The largest number of outputs to keep for each locale,
+            `months` and minimum unit, or `None` to disable the cache.
 
-    elif years == 1:
-        if num_months == 0 and days == 0:
-            return _("a year")
+    Raises:
+        ValueError: If `maxsize` is not positive.
+    """
+    global _RENDER_CACHE_SIZE
+
+    if maxsize is not None and maxsize < 1:
+        msg = f"maxsize must be positive, not {maxsize}"
+        raise ValueError(msg)
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE_SIZE = maxsize
+        _RENDER_CACHE_COUNTS[:] = [0, 0]
+        for table in list(_NATURALDELTA_TEXTS.values()):
+            table[3].clear()
 
-        if num_months == 0:
-            return _ngettext("1 year, %d day", "1 year, %d days", days) % days
 
-        if use_months:
-            if num_months == 1:
-                return _("1 year, 1 month")
+def render_cache_info() -> RenderCacheInfo | None:
+    """Return the hits, misses and size of the render cache, or `None` if disabled.
+
+    Returns:
+        RenderCacheInfo or None: The counters since the cache was last set, its
+            bound for each locale, `months` and minimum unit, and the number of
+            outputs it holds in all. Hits are counted without a lock, so threads
+            racing on them may undercount a few.
+    """
+    with _RENDER_CACHE_LOCK:
+        if _RENDER_CACHE_SIZE is None:
+            return None
+        currsize = sum(len(table[3]) for table in list(_NATURALDELTA_TEXTS.values()))
+        hits, misses = _RENDER_CACHE_COUNTS
+        return RenderCacheInfo(hits, misses, _RENDER_CACHE_SIZE, currsize)
+
+
+def _cached_render(
+    key: int,
+    future: bool | None,
+    translation: gettext.NullTranslations,
+    table: _Table,
+) -> str:
+    """Render an output of `naturaldelta`, or `naturaltime` in a tense, with the cache.
+
+    `future` is `None` for `naturaldelta`. When the cache holds more than its size
+    for `table`, the oldest outputs are dropped.
+    """
+    cached = table[3]
+    # As in the pure Python `functools.lru_cache`, hits skip the lock: reading a dict
+    # is atomic, and only changes to the cache need to be serialized.
+    text = cached.get((key, future))
+    if text is not None:
+        _RENDER_CACHE_COUNTS[0] += 1
+        return text
+
+    # Render outside of the lock, which translations may take long to do
+    if future is None:
+        text = _render_naturaldelta(key, translation, table)
+    else:
+        text = _render_naturaltime(key, future, translation, table)
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE_COUNTS[1] += 1
+        maxsize = _RENDER_CACHE_SIZE
+        if maxsize is None:
+            return text  # Disabled in the meantime
+        while len(cached) >= maxsize:
+            del cached[next(iter(cached))]
+        # Another thread may have cached the same output, which is shared then
+        return cached.setdefault((key, future), text)
+
+
+def _micros_many(
+    values: Iterable[Any], now: dt.datetime | None, future: bool, epoch: bool
+) -> tuple[Any, Any, list[bool], tuple[int, ...] | None]:
+    """Convert values to signed numbers of microseconds, as `naturaldelta` would.
+
+    If `now` is given, the values are read as `naturaltime` reads them instead:
+    datetimes are compared with `now`, numbers are rounded to whole seconds, or read
+    as POSIX timestamps if `epoch` is `True`, and a delta is positive in the past.
 
-            if num_months == 12:
-                years += 1
-                return _ngettext("%d year", "%d years", years) % years
+    Returns:
+        tuple: The values as a sequence, their numbers of microseconds as a list, or
+            a NumPy masked array for NumPy input, with `None` or masked entries for
+            values that cannot be converted, whether each is in the future, and the
+            shape of the NumPy input, or `None`.
 
-            return (
-                _ngettext("1 year, %d month", "1 year, %d months", num_months)
-                % num_months
-            )
+    Raises:
+        OverflowError: If a value is too large to convert to datetime.timedelta.
+    """
+    import datetime as dt
 
-        return _ngettext("1 year, %d day", "1 year, %d days", days) % days
+    # Aware datetimes are compared with an aware `now`, naive ones with a naive `now`
+    aware_now = None if now is None else _aware_now(now)
+    now = _convert_aware_datetime(now)
+
+    numpy = sys.modules.get("numpy")
+    if (
+        numpy is not None
+        and isinstance(values, numpy.ndarray)
+        and values.dtype.kind in "mMbiuf"
+    ):
+        array = values.ravel()
+        kind = array.dtype.kind
+        if kind == "m":
+            invalid = numpy.isnat(array)
+            micros = array.astype("timedelta64[us]").astype(numpy.int64)
+        elif kind == "M":
+            invalid = numpy.isnat(array) | (now is None)
+            now64 = numpy.datetime64(now or dt.datetime.min, "us")
+            micros = (now64 - array.astype("datetime64[us]")).astype(numpy.int64)
+        else:
+            seconds = array.astype(numpy.float64)
+            if now is not None and epoch:
+                seconds = now.timestamp() - seconds
+            elif now is not None:
+                seconds = numpy.rint(seconds)
+            invalid = numpy.isnan(seconds)
+            seconds[invalid] = 0
+            if (numpy.abs(seconds) > dt.timedelta.max.total_seconds()).any():
+                msg = "Cannot convert a number of seconds that large to a timedelta"
+                raise OverflowError(msg)
+            micros = numpy.rint(seconds * 1e6).astype(numpy.int64)
+
+        micros = numpy.ma.array(micros, mask=invalid)
+        if now is None or kind not in "mM" and not epoch:
+            futures = [future] * len(array)
+        else:
+            futures = (micros.filled(0) < 0).tolist()
+        return array, micros, futures, values.shape
+
+    items, shape = _unpack_values(values)
+    micros_list: list[int | None] = []
+    futures = []
+    for value in items:
+        is_future = future
+        try:
+            if isinstance(value, dt.datetime):
+                if now is None:
+                    raise TypeError
+                if _is_aware(value):
+                    assert aware_now is not None  # Set whenever `now` is
+                    delta = aware_now - value
+                else:
+                    delta = now - _convert_aware_datetime(value)
+            elif isinstance(value, dt.timedelta):
+                delta = value
+            elif now is None:
+                int(value)  # Explicitly don't support string such as "NaN" or "inf"
+                delta = dt.timedelta(seconds=float(value))
+            elif epoch:
+                delta = dt.timedelta(seconds=now.timestamp() - float(value))
+            else:
+                delta = dt.timedelta(seconds=round(value))
+        except (ValueError, TypeError):
+            micros_list.append(None)
+            futures.append(is_future)
+            continue
+        if isinstance(value, (dt.datetime, dt.timedelta)) or epoch:
+            is_future = delta < dt.timedelta(0)
+        micros_list.append(
+            (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+        )
+        futures.append(is_future)
+    return items, micros_list, futures, shape
+
+
+@lru_cache(maxsize=None)
+def _naturaldelta_table(months: bool, min_unit: Unit) -> tuple[list[int], list[_Message]]:
+    """Precompute what `naturaldelta` says about deltas shorter than two years.
 
-    return _ngettext("%d year", "%d years", years).replace("%d", "%s") % intcomma(years)
+    Returns:
+        tuple of lists: The sorted boundaries in microseconds at which the output
+            changes and, for each, the message used from that boundary up to the next.
+    """
+    boundaries: list[int] = []
+    messages: list[_Message] = []
+
+    def add(start: int, message: str | tuple[str, str], count: int = 1) -> None:
+        if not messages or messages[-1] != (message, count):
+            boundaries.append(start)
+            messages.append((message, count))
+
+    # Less than a second
+    if min_unit == Unit.MICROSECONDS:
+        for micros in range(1000):
+            add(micros, NS_("%d microsecond", "%d microseconds"), micros)
+    if min_unit in (Unit.MICROSECONDS, Unit.MILLISECONDS):
+        for millis in range(min_unit == Unit.MICROSECONDS, 1000):
+            add(millis * 1000, NS_("%d millisecond", "%d milliseconds"), millis)
+    else:
+        add(0, N_("a moment"))
+
+    # Less than a day: seconds, then minutes and hours rounded to the nearest
+    add(_SECOND, N_("a second"))
+    for seconds in range(2, 60):
+        add(seconds * _SECOND, NS_("%d second", "%d seconds"), seconds)
+    for seconds, minutes in _rounded_counts(60, 3600, 60):
+        if minutes == 1:
+            add(seconds * _SECOND, N_("a minute"))
+        elif minutes == 60:
+            add(seconds * _SECOND, N_("an hour"))
+        else:
+            add(seconds * _SECOND, NS_("%d minute", "%d minutes"), minutes)
+    for seconds, hours in _rounded_counts(3600, 86_400, 3600):
+        if hours == 1:
+            add(seconds * _SECOND, N_("an hour"))
+        elif hours == 24:
+            add(seconds * _SECOND, N_("a day"))
+        else:
+            add(seconds * _SECOND, NS_("%d hour", "%d hours"), hours)
+
+    # Less than two years: days, or months of 30.5 days
+    for total_days in range(1, 730):
+        years, days = divmod(total_days, 365)
+        num_months = round(days / 30.5)
+        start = total_days * _DAY
+        if years == 0:
+            if days == 1:
+                add(start, N_("a day"))
+            elif not months or num_months == 0:
+                add(start, NS_("%d day", "%d days"), days)
+            elif num_months == 1:
+                add(start, N_("a month"))
+            elif num_months == 12:
+                add(start, N_("a year"))
+            else:
+                add(start, NS_("%d month", "%d months"), num_months)
+        elif num_months == 0 and days == 0:
+            add(start, N_("a year"))
+        elif num_months == 0 or not months:
+            add(start, NS_("1 year, %d day", "1 year, %d days"), days)
+        elif num_months == 1:
+            add(start, N_("1 year, 1 month"))
+        elif num_months == 12:
+            add(start, NS_("%d year", "%d years"), 2)
+        else:
+            add(start, NS_("1 year, %d month", "1 year, %d months"), num_months)
+
+    return boundaries, messages
+
+
+def _rounded_counts(start: int, stop: int, unit: int) -> Iterator[tuple[int, int]]:
+    """Yield where `round(n / unit)` takes each of its values for `n` in a range.
+
+    `unit` must be even, so that halves fall on integers and round to even.
+
+    >>> list(_rounded_counts(60, 200, 60))
+    [(60, 1), (90, 2), (151, 3)]
+    """
+    count = round(start / unit)
+    first = start
+    while first < stop:
+        yield first, count
+        count += 1
+        first = count * unit - unit // 2 + count % 2
 
 
 def naturaltime(
@@ -270,16 +659,21 @@ def naturaltime(
         minimum_unit (str): The lowest unit that can be used.
         when (datetime.datetime): Point in time relative to which _value_ is
             interpreted.  Defaults to the current time in the local timezone.
+            Aware datetimes are compared with `when` as aware datetimes, so the
+            difference is exact even across daylight saving time changes.
 
     Returns:
         str: A natural representation of the input in a resolution that makes sense.
     """
     import datetime as dt
 
-    value = _convert_aware_datetime(value)
-    when = _convert_aware_datetime(when)
-
-    now = when or _now()
+    if isinstance(value, dt.datetime) and _is_aware(value):
+        # Compare aware datetimes directly, without converting them to local time
+        now = _aware_now(when)
+    else:
+        value = _convert_aware_datetime(value)
+        when = _convert_aware_datetime(when)
+        now = when or _now()
 
     date, delta = _date_and_delta(value, now=now)
     if date is None:
@@ -288,13 +682,13 @@ def naturaltime(
     if isinstance(value, (dt.datetime, dt.timedelta)):
         future = date > now
 
-    ago = _("%s from now") if future else _("%s ago")
-    delta = naturaldelta(delta, months, minimum_unit)
-
-    if delta == _("a moment"):
-        return _("now")
-
-    return str(ago % delta)
+    translation = get_translation()
+    table = _naturaldelta_texts(translation, bool(months), minimum_unit)
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    key = _naturaldelta_key(micros, table[0])
+    if _RENDER_CACHE_SIZE is None:
+        return _render_naturaltime(key, future, translation, table)
+    return _cached_render(key, bool(future), translation, table)
 
 
 def _convert_aware_datetime(
@@ -308,6 +702,97 @@ def _convert_aware_datetime(
     return value
 
 
+def _is_aware(value: dt.datetime) -> bool:
+    """Return whether `value` is an aware datetime, as defined by `datetime`."""
+    return value.tzinfo is not None and value.utcoffset() is not None
+
+
+def _aware_now(when: dt.datetime | None) -> dt.datetime:
+    """Return `when` as an aware datetime in UTC, or the current time if it is `None`.
+
+    A naive `when` is taken to be in the local timezone. Subtracting an aware datetime
+    from the result accounts for both UTC offsets, which is not the case when both
+    share a `tzinfo` with daylight saving time.
+    """
+    import datetime as dt
+
+    if when is None:
+        return dt.datetime.now(dt.timezone.utc)
+    if not _is_aware(when):
+        when = _convert_aware_datetime(when).astimezone()
+    return when.astimezone(dt.timezone.utc)
+
+
+def naturaltime_many(
+    values: Iterable[Any],
+    future: bool = False,
+    months: bool = True,
+    minimum_unit: str = "seconds",
+    when: dt.datetime | None = None,
+    epoch: bool = False,
+) -> Any:
+    """Return natural representations of many times, relative to a single instant.
+
+    This is the batch version of `naturaltime`. The current time is read only once,
+    so every value is compared with the same instant. NumPy `datetime64`,
+    `timedelta64` and numeric arrays are converted and looked up in the boundary
+    table of `naturaldelta` all at once, and every distinct output is rendered only
+    once.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> when = dt.datetime(2024, 1, 1, 12, 0)
+        >>> naturaltime_many(
+        ...     [dt.datetime(2024, 1, 1, 11, 30), dt.timedelta(hours=-2), 0, "x"],
+        ...     when=when,
+        ... )
+        ['30 minutes ago', '2 hours from now', 'now', 'x']
+
+        ```
+
+    Args:
+        values (iterable): `datetime`s, `timedelta`s or numbers of seconds. NumPy
+            arrays of `datetime64`, of `timedelta64` or of numbers are accepted.
+        future (bool): Ignored for `datetime`s and `timedelta`s, where the tense is
+            always figured out based on the current time. For integers and floats, the
+            return value will be past tense by default, unless future is `True`.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+        when (datetime.datetime): Point in time relative to which the values are
+            interpreted. Defaults to the current time in the local timezone.
+        epoch (bool): If `True`, numbers are POSIX timestamps rather than numbers of
+            seconds, and the tense is figured out like for `datetime`s.
+
+    Returns:
+        list of str or numpy.ndarray: The natural representations, in the same order.
+            Values that cannot be interpreted as times are returned as strings. A
+            NumPy array input gives an object array of the same shape.
+
+    Raises:
+        OverflowError: If a value is too large to convert to datetime.timedelta.
+    """
+    translation = get_translation()
+    table = _naturaldelta_texts(translation, bool(months), minimum_unit)
+    now = when or _now()
+    items, micros, futures, shape = _micros_many(values, now, future, epoch)
+    keys = _naturaldelta_keys(micros, table[0])
+
+    rendered: dict[tuple[int, bool], str] = {}
+    results = []
+    for index, (key, is_future) in enumerate(zip(keys, futures)):
+        if key is None:
+            results.append(str(items[index]))
+            continue
+        text = rendered.get((key, is_future))
+        if text is None:
+            text = _render_naturaltime(key, is_future, translation, table)
+            rendered[key, is_future] = text
+        results.append(text)
+    return _pack_results(results, shape)
+
+
 def naturalday(value: dt.date | dt.datetime, format: str = "%b %d") -> str:
     """Return a natural day.
 
@@ -326,7 +811,12 @@ def naturalday(value: dt.date | dt.datetime, format: str = "%b %d") -> str:
     except (OverflowError, ValueError):
         # Date arguments out of range
         return str(value)
-    delta = value - dt.date.today()
+    return _naturalday(value, _today(), format)
+
+
+def _naturalday(value: dt.date, today: dt.date, format: str) -> str:
+    """Implementation of `naturalday` for a date, given the current local date."""
+    delta = value - today
 
     if delta.days == 0:
         return _("today")
@@ -342,6 +832,11 @@ def naturalday(value: dt.date | dt.datetime, format: str = "%b %d") -> str:
 
 def naturaldate(value: dt.date | dt.datetime) -> str:
     """Like `naturalday`, but append a year for dates more than ~five months away."""
+    return _naturaldate(value, _today())
+
+
+def _naturaldate(value: Any, today: dt.date) -> str:
+    """Implementation of `naturaldate`, given the current local date."""
     import datetime as dt
 
     try:
@@ -352,55 +847,87 @@ def naturaldate(value: dt.date | dt.datetime) -> str:
     except (OverflowError, ValueError):
         # Date arguments out of range
         return str(value)
-    delta = _abs_timedelta(value - dt.date.today())
-    if delta.days >= 5 * 365 / 12:
-        return naturalday(value, "%b %d %Y")
-    return naturalday(value)
+    if abs((value - today).days) >= 5 * 365 / 12:
+        return _naturalday(value, today, "%b %d %Y")
+    return _naturalday(value, today, "%b %d")
 
 
-def _quotient_and_remainder(
-    value: float,
-    divisor: float,
-    unit: Unit,
-    minimum_unit: Unit,
-    suppress: Iterable[Unit],
-    format: str,
-) -> tuple[float, float]:
-    """Divide `value` by `divisor`, returning the quotient and remainder.
+def naturaldate_many(values: Iterable[Any]) -> Any:
+    """Apply `naturaldate` to many dates or datetimes.
 
-    If `unit` is `minimum_unit`, the quotient will be the rounding of `value / divisor`
-    according to the `format` string and the remainder will be zero. The rationale is
-    that if `unit` is the unit of the quotient, we cannot represent the remainder
-    because it would require a unit smaller than the `minimum_unit`.
+    The current date is read once for the whole batch and every distinct date is
+    formatted only once, which makes this much faster than a loop on `naturaldate`
+    for a table with many rows per day.
 
-    >>> from humanize.time import _quotient_and_remainder, Unit
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.DAYS, [], "%0.2f")
-    (1.5, 0)
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> today = dt.date.today()
+        >>> naturaldate_many([today, today, today - dt.timedelta(days=1), "x"])
+        ['today', 'today', 'yesterday', 'x']
 
-    If `unit` is in `suppress`, the quotient will be zero and the remainder will be the
-    initial value. The idea is that if we cannot use `unit`, we are forced to use a
-    lower unit, so we cannot do the division.
+        ```
 
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.HOURS, [Unit.DAYS], "%0.2f")
-    (0, 36)
+    Args:
+        values (iterable): Dates or datetimes. NumPy arrays of `datetime64` are
+            accepted.
 
-    In other cases, return the quotient and remainder as `divmod` would do it.
+    Returns:
+        list of str or numpy.ndarray: The natural dates, in the same order. Values
+            that are not date-ish are returned as strings. A NumPy array input gives
+            an object array of the same shape.
+    """
+    import datetime as dt
 
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.HOURS, [], "%0.2f")
-    (1, 12)
+    today = _today()
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray) and values.dtype.kind == "M":
+        days, inverse = numpy.unique(
+            values.ravel().astype("datetime64[D]"), return_inverse=True
+        )
+        texts = []
+        for day in days:
+            # NaT gives None, and a day beyond the range of `dt.date` gives an int
+            date = day.item()
+            texts.append(_naturaldate(date, today) if isinstance(date, dt.date) else str(day))
+        return _pack_results([texts[index] for index in inverse.tolist()], values.shape)
+
+    items, shape = _unpack_values(values)
+    rendered: dict[dt.date, str] = {}
+    results = []
+    for value in items:
+        try:
+            date = dt.date(value.year, value.month, value.day)
+        except (AttributeError, OverflowError, ValueError):
+            results.append(str(value))
+            continue
+        text = rendered.get(date)
+        if text is None:
+            text = rendered[date] = _naturaldate(date, today)
+        results.append(text)
+    return _pack_results(results, shape)
 
-    """
-    if unit == minimum_unit:
-        return _rounding_by_fmt(format, value / divisor), 0
 
-    if unit in suppress:
-        return 0, value
+# The local date, and the timestamps of its start and of the next local midnight:
+# the date is read again once the clock is outside of that range
+_TODAY: tuple[dt.date | None, float, float] = (None, 0.0, 0.0)
 
-    # Convert the remainder back to integer is necessary for months. 1 month is 30.5
-    # days on average, but if we have 31 days, we want to count is as a whole month,
-    # and not as 1 month plus a remainder of 0.5 days.
-    q, r = divmod(value, divisor)
-    return q, int(r)
+
+def _today() -> dt.date:
+    """Return the local date, reading it again only once the clock leaves that day.
+
+    The clock may also move backwards, e.g. when it is set or frozen in tests.
+    """
+    import datetime as dt
+
+    global _TODAY
+    today, start, end = _TODAY
+    if today is None or not start <= _time.time() < end:
+        today = dt.date.today()
+        start = dt.datetime.combine(today, dt.time()).timestamp()
+        end = dt.datetime.combine(today + dt.timedelta(days=1), dt.time()).timestamp()
+        _TODAY = (today, start, end)
+    return today
 
 
 def _suitable_minimum_unit(min_unit: Unit, suppress: Iterable[Unit]) -> Unit:
@@ -523,132 +1050,185 @@ def precisedelta(
     date, delta = _date_and_delta(value, precise=True)
     if date is None:
         return str(value)
+    return _precisedelta_plan(minimum_unit, tuple(suppress), format)._format(delta)
 
-    suppress_set = {Unit[s.upper()] for s in suppress}
 
-    # Find a suitable minimum unit (it can be greater than the one that the
-    # user gave us, if that one is suppressed).
-    min_unit = Unit[minimum_unit.upper()]
-    min_unit = _suitable_minimum_unit(min_unit, suppress_set)
-    del minimum_unit
+@lru_cache(maxsize=128)
+def _precisedelta_plan(
+    minimum_unit: str, suppress: tuple[str, ...], format: str
+) -> PrecisedeltaPlan:
+    """Return the plan of `precisedelta` for a set of options, once per set."""
+    return PrecisedeltaPlan(minimum_unit, suppress, format)
 
-    # Expand the suppressed units list/set to include all the units
-    # that are below the minimum unit
-    suppress_set = _suppress_lower_units(min_unit, suppress_set)
 
-    # handy aliases
-    days = delta.days
-    secs = delta.seconds
-    usecs = delta.microseconds
+# Size of each unit of `precisedelta`, from years down, as a fraction of days for
+# years and months, of seconds down to minutes and of microseconds below
+_PRECISEDELTA_SIZES = (
+    (365, 1),
+    (61, 2),
+    (86_400, 1),
+    (3600, 1),
+    (60, 1),
+    (1_000_000, 1),
+    (1000, 1),
+    (1, 1),
+)
 
-    MICROSECONDS, MILLISECONDS, SECONDS, MINUTES, HOURS, DAYS, MONTHS, YEARS = list(
-        Unit
-    )
+# Count of each unit which is promoted to one of the unit above, if any
+_PRECISEDELTA_CARRIES = (0, 12, 31, 24, 60, 60, 1000, 0)
 
-    # Given DAYS compute YEARS and the remainder of DAYS as follows:
-    #   if YEARS is the minimum unit, we cannot use DAYS so
-    #   we will use a float for YEARS and 0 for DAYS:
-    #       years, days = years/days, 0
-    #
-    #   if YEARS is suppressed, use DAYS:
-    #       years, days = 0, days
-    #
-    #   otherwise:
-    #       years, days = divmod(years, days)
-    #
-    # The same applies for months, hours, minutes and milliseconds below
-    years, days = _quotient_and_remainder(
-        days, 365, YEARS, min_unit, suppress_set, format
-    )
-    months, days = _quotient_and_remainder(
-        days, 30.5, MONTHS, min_unit, suppress_set, format
-    )
 
-    secs = days * 24 * 3600 + secs
-    days, secs = _quotient_and_remainder(
-        secs, 24 * 3600, DAYS, min_unit, suppress_set, format
-    )
+class PrecisedeltaPlan:
+    """`precisedelta` with its options resolved once, for formatting many values.
 
-    hours, secs = _quotient_and_remainder(
-        secs, 3600, HOURS, min_unit, suppress_set, format
-    )
-    minutes, secs = _quotient_and_remainder(
-        secs, 60, MINUTES, min_unit, suppress_set, format
-    )
+    `precisedelta` has to parse `suppress`, find a suitable minimum unit and list the
+    units to show on every call. A plan does that when it is created and can then be
+    called like `precisedelta` with only the value.
 
-    usecs = secs * 1e6 + usecs
-    secs, usecs = _quotient_and_remainder(
-        usecs, 1e6, SECONDS, min_unit, suppress_set, format
-    )
-
-    msecs, usecs = _quotient_and_remainder(
-        usecs, 1000, MILLISECONDS, min_unit, suppress_set, format
-    )
-
-    # Due to rounding, it could be that a unit is high enough to be promoted to a higher
-    # unit. Example: 59.9 minutes was rounded to 60 minutes, and thus it should become 0
-    # minutes and one hour more.
-    if msecs >= 1_000 and SECONDS not in suppress_set:
-        msecs -= 1_000
-        secs += 1
-    if secs >= 60 and MINUTES not in suppress_set:
-        secs -= 60
-        minutes += 1
-    if minutes >= 60 and HOURS not in suppress_set:
-        minutes -= 60
-        hours += 1
-    if hours >= 24 and DAYS not in suppress_set:
-        hours -= 24
-        days += 1
-    # When adjusting we should not deal anymore with fractional days as all rounding has
-    # been already made. We promote 31 days to an extra month.
-    if days >= 31 and MONTHS not in suppress_set:
-        days -= 31
-        months += 1
-    if months >= 12 and YEARS not in suppress_set:
-        months -= 12
-        years += 1
-
-    fmts = [
-        ("%d year", "%d years", years),
-        ("%d month", "%d months", months),
-        ("%d day", "%d days", days),
-        ("%d hour", "%d hours", hours),
-        ("%d minute", "%d minutes", minutes),
-        ("%d second", "%d seconds", secs),
-        ("%d millisecond", "%d milliseconds", msecs),
-        ("%d microsecond", "%d microseconds", usecs),
-    ]
-
-    texts: list[str] = []
-    for unit, fmt in zip(reversed(Unit), fmts):
-        singular_txt, plural_txt, fmt_value = fmt
-        if fmt_value > 0 or (not texts and unit == min_unit):
-            _fmt_value = 2 if 1 < fmt_value < 2 else int(fmt_value)
-            fmt_txt = _ngettext(singular_txt, plural_txt, _fmt_value)
-            import math
-
-            if unit == min_unit and math.modf(fmt_value)[0] > 0:
-                fmt_txt = fmt_txt.replace("%d", format)
-            elif unit == YEARS:
-                if math.modf(fmt_value)[0] == 0:
-                    fmt_value = int(fmt_value)
-                fmt_txt = fmt_txt.replace("%d", "%s")
-                texts.append(fmt_txt % intcomma(fmt_value))
-                continue
-
-            texts.append(fmt_txt % fmt_value)
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> plan = PrecisedeltaPlan(minimum_unit="minutes", suppress=["days"])
+        >>> plan(dt.timedelta(days=2, seconds=3633))
+        '49 hours and 0.55 minutes'
+        >>> plan.map([60, 5400, "x"])
+        ['1 minute', '1 hour and 30 minutes', 'x']
 
-        if unit == min_unit:
-            break
+        ```
 
-    if len(texts) == 1:
-        return texts[0]
+    Args:
+        minimum_unit (str): As for `precisedelta`.
+        suppress (iterable of str): As for `precisedelta`.
+        format (str): As for `precisedelta`.
 
-    head = ", ".join(texts[:-1])
-    tail = texts[-1]
+    Raises:
+        ValueError: If the minimum unit is suppressed and no suitable replacement
+            exists.
+    """
 
-    return _("%s and %s") % (head, tail)
+    def __init__(
+        self,
+        minimum_unit: str = "seconds",
+        suppress: Iterable[str] = (),
+        format: str = "%0.2f",
+    ) -> None:
+        self.minimum_unit = minimum_unit
+        self.suppress = tuple(suppress)
+        self.format = format
+
+        suppress_set = {Unit[s.upper()] for s in self.suppress}
+
+        # Find a suitable minimum unit (it can be greater than the one that the
+        # user gave us, if that one is suppressed).
+        self._min_unit = _suitable_minimum_unit(
+            Unit[minimum_unit.upper()], suppress_set
+        )
+
+        # Expand the suppressed units list/set to include all the units
+        # that are below the minimum unit
+        self._suppress = _suppress_lower_units(self._min_unit, suppress_set)
+
+        # The units that can be shown, from the largest down to the minimum unit, and
+        # whether each of them takes its share of the delta
+        self._units = [unit for unit in reversed(Unit) if unit >= self._min_unit]
+        self._split = [unit not in self._suppress for unit in self._units]
+        self._messages = [
+            NS_("%d year", "%d years"),
+            NS_("%d month", "%d months"),
+            NS_("%d day", "%d days"),
+            NS_("%d hour", "%d hours"),
+            NS_("%d minute", "%d minutes"),
+            NS_("%d second", "%d seconds"),
+            NS_("%d millisecond", "%d milliseconds"),
+            NS_("%d microsecond", "%d microseconds"),
+        ][: len(self._units)]
+
+    def __call__(self, value: dt.timedelta | float | None) -> str:
+        """Format a single value, like `precisedelta`."""
+        date, delta = _date_and_delta(value, precise=True)
+        if date is None:
+            return str(value)
+        return self._format(delta)
+
+    def map(self, values: Iterable[Any]) -> Any:
+        """Format every value of an iterable.
+
+        Args:
+            values (iterable): Timedeltas or numbers of seconds. NumPy arrays are
+                accepted.
+
+        Returns:
+            list of str or numpy.ndarray: The formatted values, in the same order. A
+                NumPy array input gives an object array of the same shape.
+        """
+        items, shape = _unpack_values(values)
+        return _pack_results([self(value) for value in items], shape)
+
+    def __repr__(self) -> str:
+        return (
+            f"PrecisedeltaPlan(minimum_unit={self.minimum_unit!r}, "
+            f"suppress={list(self.suppress)!r}, format={self.format!r})"
+        )
+
+    def _format(self, delta: dt.timedelta) -> str:
+        """Format a non-negative timedelta."""
+        format = self.format
+        counts: list[float] = [0] * len(self._units)
+        last = len(counts) - 1
+
+        # Split the delta with exact integers, from the largest unit down: whole days
+        # for years and months, then whole seconds down to minutes, then microseconds
+        value = delta.days
+        rest = delta.seconds * 1_000_000 + delta.microseconds
+        for index, split in enumerate(self._split):
+            if index == 2:
+                value = value * 86_400 + rest // 1_000_000
+            elif index == 5:
+                value = value * 1_000_000 + rest % 1_000_000
+            size, scale = _PRECISEDELTA_SIZES[index]
+            if index == last:
+                # The minimum unit gets the rest of the delta, rounded once
+                counts[index] = _rounding_by_fmt(format, value * scale / size)
+            elif split:
+                count = value * scale // size
+                counts[index] = count
+                # Only whole days are left over by months of 30.5 days
+                value -= -(-count * size // scale)
+
+        # Due to rounding, the minimum unit can reach a whole unit above it. Example:
+        # 59.999 seconds were rounded to 60 seconds, and make one minute more.
+        for index in range(last, 0, -1):
+            carry = _PRECISEDELTA_CARRIES[index]
+            if carry and counts[index] >= carry and self._split[index - 1]:
+                counts[index] -= carry
+                counts[index - 1] += 1
+
+        ngettext = get_translation().ngettext
+        texts: list[str] = []
+        for index, (singular_txt, plural_txt) in enumerate(self._messages):
+            fmt_value = counts[index]
+            if fmt_value > 0 or (not texts and index == last):
+                _fmt_value = 2 if 1 < fmt_value < 2 else int(fmt_value)
+                fmt_txt = ngettext(singular_txt, plural_txt, _fmt_value)
+
+                if index == last and math.modf(fmt_value)[0] > 0:
+                    fmt_txt = fmt_txt.replace("%d", format)
+                elif index == 0:  # Years
+                    if math.modf(fmt_value)[0] == 0:
+                        fmt_value = int(fmt_value)
+                    fmt_txt = fmt_txt.replace("%d", "%s")
+                    texts.append(fmt_txt % intcomma(fmt_value))
+                    continue
+
+                texts.append(fmt_txt % fmt_value)
+
+        if len(texts) == 1:
+            return texts[0]
+
+        head = ", ".join(texts[:-1])
+        tail = texts[-1]
+
+        return _("%s and %s") % (head, tail)
 
 
 def _rounding_by_fmt(format: str, value: float) -> float | int: